@@ -4,10 +4,10 @@ Application Configuration Settings
 This module contains all configuration settings for the Grammar Correction API.
 """
 
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -31,6 +31,12 @@ class Settings(BaseSettings):
     
     # Database Configuration
     DATABASE_URL: str = f"sqlite:///{PROJECT_ROOT}/data/grammar.db"
+    # Sized to cover the FastAPI threadpool (40 threads) so sync handlers
+    # never queue on a connection checkout
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 3600  # seconds; drop connections idle-killed by the server
     
     # AI Model Configuration
     MODEL_NAME: str = "vennify/t5-base-grammar-correction"  # Current model
@@ -41,6 +47,8 @@ class Settings(BaseSettings):
     # "google/flan-t5-base" - Better instruction following
     MODEL_DIR: str = str(PROJECT_ROOT / "models" / "grammar_correction")
     DEVICE: str = "cpu"  # "cuda" for GPU, "cpu" for CPU
+    MODEL_RUNTIME: str = "torch"  # "torch" or "onnxruntime" (needs optimum[onnxruntime])
+    MODEL_PRELOAD: bool = True  # Load the model in the background at startup
     
     # Model Performance Settings
     MODEL_MAX_LENGTH: int = 512
@@ -48,6 +56,14 @@ class Settings(BaseSettings):
     MODEL_TOP_P: float = 0.9
     MODEL_REPETITION_PENALTY: float = 1.1
     MODEL_DO_SAMPLE: bool = False  # Use greedy decoding for consistency
+    MODEL_BATCH_SIZE: int = 8  # Texts per forward pass in batch corrections
+    # Int8 dynamic quantization (CPU only, opt-in): faster decoding, but
+    # activations are quantized at runtime too, so corrections can differ from
+    # the fp32 model; also disables MODEL_COMPILE
+    MODEL_QUANTIZE_INT8: bool = False
+    MODEL_BF16: bool = True  # Load weights in bfloat16 on GPUs that support it
+    MODEL_COMPILE: bool = True  # torch.compile the forward pass (unquantized models)
+    CORRECTION_CACHE_SIZE: int = 4096  # Memoized corrections per process
     
     # Fallback Settings
     USE_BASIC_RULES_FIRST: bool = True
@@ -66,7 +82,20 @@ class Settings(BaseSettings):
     MAX_LOGIN_ATTEMPTS: int = 5
     LOGIN_LOCKOUT_MINUTES: int = 15
     PASSWORD_MIN_LENGTH: int = 8
+    BCRYPT_COST: int = 12  # bcrypt work factor (log2 rounds)
     REQUIRE_SPECIAL_CHARS: bool = True
+    TOKEN_CLEANUP_INTERVAL_SECONDS: int = 300  # Purge expired blacklist entries
+    TOKEN_CLEANUP_BATCH_SIZE: int = 10000
+    
+    # Lookup Cache Configuration (per process)
+    # Other workers only see a user's deactivation, demotion or deletion once
+    # their cached copy expires, so keep this as short as the blacklist misses
+    USER_CACHE_TTL_SECONDS: int = 5
+    USER_CACHE_MAX_SIZE: int = 10000
+    TOKEN_BLACKLIST_HIT_TTL_SECONDS: int = 60
+    TOKEN_BLACKLIST_MISS_TTL_SECONDS: int = 5
+    STATS_CACHE_TTL_SECONDS: int = 30
+    CORRECTIONS_CACHE_TTL_SECONDS: int = 30  # Only used when WORKERS == 1
     
     # CORS Configuration
     ALLOWED_ORIGINS: list = ["*"]
@@ -86,15 +115,24 @@ class Settings(BaseSettings):
     MODELS_DIR: Path = PROJECT_ROOT / "models"
     LOGS_DIR: Path = PROJECT_ROOT / "logs"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, parsing `.env` only once."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
-# Ensure directories exist
-settings.DATA_DIR.mkdir(exist_ok=True)
-settings.MODELS_DIR.mkdir(exist_ok=True)
-settings.LOGS_DIR.mkdir(exist_ok=True)
+# Ensure directories exist (checked on every start: data/ is often wiped to
+# reset the database)
+for _directory in (settings.DATA_DIR, settings.MODELS_DIR, settings.LOGS_DIR):
+    _directory.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,16 @@
+"""
+Script Bootstrap
+
+Makes the project root and src directory importable for the scripts in this
+folder. Import it before any project imports.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+
+for _path in (str(SRC_DIR), str(PROJECT_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -8,43 +8,42 @@ Run this script after setting up the database to create the first admin user.
 
 import sys
 import os
-from pathlib import Path
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import _bootstrap  # noqa: F401  (adds project root and src to sys.path)
+from sqlalchemy import or_
 
 from grammar_app.database import SessionLocal, engine
 from grammar_app.models import Base, User
-from grammar_app.crud import create_admin_user
+from grammar_app.crud import create_admin_user as crud_create_admin
 from config.settings import settings
 
 
-def create_admin_user(email: str, full_name: str, password: str):
-    """Create an admin user in the database."""
-    # Create tables if they don't exist
-    Base.metadata.create_all(bind=engine)
-    
+def ensure_admin_user(email: str, full_name: str, password: str):
+    """Create an admin user in the database (tables must already exist)."""
     db = SessionLocal()
     try:
+        # Look up any existing admin and any user with this email in one query
+        candidates = (
+            db.query(User).filter(or_(User.role == "admin", User.email == email)).all()
+        )
+        existing_admin = next((u for u in candidates if u.role == "admin"), None)
+        existing_user = next((u for u in candidates if u.email == email), None)
+        
         # Check if admin user already exists
-        existing_admin = db.query(User).filter(User.role == "admin").first()
         if existing_admin:
             print(f"Admin user already exists: {existing_admin.email}")
             return existing_admin
         
         # Check if user with this email already exists
-        existing_user = db.query(User).filter(User.email == email).first()
         if existing_user:
             print(f"User with email {email} already exists. Updating to admin role...")
             existing_user.role = "admin"
             db.commit()
-            db.refresh(existing_user)
-            print(f"User {existing_user.email} is now an admin!")
+            print(f"User {email} is now an admin!")
             return existing_user
         
         # Create new admin user using the CRUD function
-        admin_user = create_admin_user(db, email=email, full_name=full_name, password=password)
+        admin_user = crud_create_admin(db, email=email, full_name=full_name, password=password)
         
         print(f"✅ Admin user created successfully!")
         print(f"   Email: {admin_user.email}")
@@ -77,11 +76,14 @@ def main():
     print(f"Admin Password: {admin_password}")
     print()
     
+    # Create tables if they don't exist
+    Base.metadata.create_all(bind=engine)
+    
     # If environment variables are set, create admin automatically
     if os.getenv("ADMIN_EMAIL") and os.getenv("ADMIN_PASSWORD"):
         print("✅ Environment variables detected. Creating admin user automatically...")
         try:
-            admin_user = create_admin_user(admin_email, admin_name, admin_password)
+            admin_user = ensure_admin_user(admin_email, admin_name, admin_password)
             print()
             print("🎉 Admin user setup complete!")
             print("You can now use this account to access admin-only endpoints.")
@@ -100,7 +102,7 @@ def main():
             return
         
         try:
-            admin_user = create_admin_user(admin_email, admin_name, admin_password)
+            admin_user = ensure_admin_user(admin_email, admin_name, admin_password)
             print()
             print("🎉 Admin user setup complete!")
             print("You can now use this account to access admin-only endpoints.")
@@ -5,17 +5,54 @@ Model Testing and Comparison Script
 This script tests different grammar correction models to find the best one.
 """
 
-import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import json
+import re
 import time
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import _bootstrap  # noqa: F401  (adds project root and src to sys.path)
+import torch
+import transformers
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 from config.settings import settings
 
+# Prompt prefixes some models echo back before the corrected text
+_PREFIX_RE = re.compile(
+    r"^(?:grammar:|Correct the grammar in this text:|Corrected text:|Corrected:)\s*"
+)
+
+
+# Benchmark-only safetensors snapshots, one directory per model. Kept apart
+# from settings.MODEL_DIR, which the service loads without checking which
+# model it holds.
+_SNAPSHOT_ROOT = Path(settings.MODEL_DIR).parent / "benchmark_snapshots"
+
+# Marker in each snapshot recording which model/library version it holds
+_LOCAL_MODEL_TAG = ".model_tag"
+
+
+def _local_model_tag(model_name: str) -> str:
+    """Tag identifying a local snapshot of model_name for this transformers version."""
+    return f"{model_name}@{transformers.__version__}"
+
+
+def _local_snapshot_dir(model_name: str) -> Path:
+    """Directory of the benchmark snapshot of model_name."""
+    return _SNAPSHOT_ROOT / model_name.replace("/", "--")
+
+
+def _local_snapshot_is_current(model_name: str) -> bool:
+    """Check whether the benchmark snapshot of model_name is up to date."""
+    tag_file = _local_snapshot_dir(model_name) / _LOCAL_MODEL_TAG
+    return tag_file.exists() and tag_file.read_text() == _local_model_tag(model_name)
+
+
+def _init_worker(num_threads: int):
+    """Limit torch threads per worker process to avoid CPU oversubscription."""
+    torch.set_num_threads(num_threads)
+
 
 def test_model_performance(model_name: str, test_cases: list):
     """Test a specific model's performance on grammar correction."""
@@ -27,73 +64,122 @@ def test_model_performance(model_name: str, test_cases: list):
         print(f"Loading model {model_name}...")
         start_time = time.time()
         
-        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        # Models are cached as local safetensors snapshots, which load via
+        # mmap instead of going through the hub snapshot cache
+        snapshot_dir = _local_snapshot_dir(model_name)
+        use_local = _local_snapshot_is_current(model_name)
+        source = str(snapshot_dir) if use_local else model_name
+        
+        # Same precision as the service: bfloat16 on GPUs that support it
+        # (not float16, which overflows in T5), fp32 everywhere else
+        use_bf16 = (
+            settings.MODEL_BF16
+            and settings.DEVICE == "cuda"
+            and torch.cuda.is_bf16_supported()
+        )
+        dtype = torch.bfloat16 if use_bf16 else torch.float32
+        # Load weights straight onto the target device without a CPU copy
+        model = AutoModelForSeq2SeqLM.from_pretrained(
+            source,
+            torch_dtype=dtype,
+            low_cpu_mem_usage=True,
+            device_map=settings.DEVICE,
+        )
+        model.eval()
+        tokenizer = AutoTokenizer.from_pretrained(source)
+        
+        # Only cache full-precision weights; the tag is written last, so an
+        # interrupted save is redone on the next run
+        if not use_local and dtype == torch.float32:
+            model.save_pretrained(snapshot_dir, safe_serialization=True)
+            tokenizer.save_pretrained(snapshot_dir)
+            (snapshot_dir / _LOCAL_MODEL_TAG).write_text(_local_model_tag(model_name))
+        
+        # Compile the forward pass that generate() calls on every decoding step
+        if hasattr(torch, "compile"):
+            compile_mode = (
+                "reduce-overhead" if settings.DEVICE == "cuda"
+                else "max-autotune-no-cudagraphs"
+            )
+            model.forward = torch.compile(model.forward, mode=compile_mode, dynamic=True)
+        
+        # Fix the decoding strategy once on the model instead of per call
+        model.generation_config.update(
+            max_new_tokens=128,
+            do_sample=False,
+            num_beams=1,
+            num_return_sequences=1,
+        )
         
         # Create pipeline
         pipe = pipeline(
             "text2text-generation",
             model=model,
             tokenizer=tokenizer,
-            device=settings.DEVICE,
         )
         
+        # Every test case goes through the pipeline in a single batch
+        inputs = [test_case["input"] for test_case in test_cases]
+        
+        # Warm up on the timed batch itself so compilation (which specializes
+        # on the batch shape) and allocator setup count as load time rather
+        # than skewing the measured correction time
+        with torch.inference_mode():
+            pipe(inputs or ["warm up"], batch_size=max(1, len(inputs)))
+        
         load_time = time.time() - start_time
         print(f"✅ Model loaded in {load_time:.2f} seconds")
         
-        # Test cases
         results = []
         total_time = 0
         
-        for i, test_case in enumerate(test_cases, 1):
+        start_time = time.time()
+        try:
+            with torch.inference_mode():
+                outputs = pipe(inputs, batch_size=len(inputs))
+            total_time = time.time() - start_time
+            batch_error = None
+        except Exception as e:
+            outputs = [None] * len(inputs)
+            batch_error = e
+        
+        correction_time = total_time / len(inputs) if inputs else 0
+        
+        for i, (test_case, result) in enumerate(zip(test_cases, outputs), 1):
             original = test_case["input"]
             expected = test_case.get("expected", "N/A")
             
             print(f"\nTest {i}: '{original}'")
             
-            # Time the correction
-            start_time = time.time()
-            try:
-                result = pipe(
-                    original,
-                    max_new_tokens=128,
-                    temperature=0.1,
-                    do_sample=False,
-                    num_return_sequences=1,
-                )
-                correction_time = time.time() - start_time
-                total_time += correction_time
-                
-                corrected = result[0]["generated_text"].strip()
-                
-                # Clean up response
-                for prefix in ["grammar:", "Correct the grammar in this text:", "Corrected text:", "Corrected:"]:
-                    if corrected.startswith(prefix):
-                        corrected = corrected.replace(prefix, "").strip()
-                
-                print(f"   Output: '{corrected}'")
-                print(f"   Expected: '{expected}'")
-                print(f"   Time: {correction_time:.3f}s")
-                
-                if expected != "N/A":
-                    accuracy = "✅" if corrected.lower() == expected.lower() else "❌"
-                    print(f"   Accuracy: {accuracy}")
-                
-                results.append({
-                    "input": original,
-                    "output": corrected,
-                    "expected": expected,
-                    "time": correction_time
-                })
-                
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
+            if batch_error is not None:
+                print(f"   ❌ Error: {batch_error}")
                 results.append({
                     "input": original,
-                    "output": f"ERROR: {e}",
+                    "output": f"ERROR: {batch_error}",
                     "expected": expected,
                     "time": 0
                 })
+                continue
+            
+            corrected = result[0]["generated_text"].strip()
+            
+            # Clean up response
+            corrected = _PREFIX_RE.sub("", corrected, count=1).strip()
+            
+            print(f"   Output: '{corrected}'")
+            print(f"   Expected: '{expected}'")
+            print(f"   Time (batch average): {correction_time:.3f}s")
+            
+            if expected != "N/A":
+                accuracy = "✅" if corrected.lower() == expected.lower() else "❌"
+                print(f"   Accuracy: {accuracy}")
+            
+            results.append({
+                "input": original,
+                "output": corrected,
+                "expected": expected,
+                "time": correction_time
+            })
         
         # Summary
         avg_time = total_time / len(test_cases) if test_cases else 0
@@ -145,18 +231,38 @@ def main():
         "microsoft/DialoGPT-medium",  # Conversational
     ]
     
-    all_results = []
+    # Results are written one JSON line per model as soon as each finishes
+    output_file = Path(__file__).parent.parent / "data" / "model_comparison_results.jsonl"
+    output_file.parent.mkdir(exist_ok=True)
     
-    for model_name in models_to_test:
-        result = test_model_performance(model_name, test_cases)
-        all_results.append(result)
+    # Models run one at a time by default: concurrent models compete for the
+    # same cores and memory, so the timings (and the speed ranking below)
+    # would measure contention rather than the models. MODEL_TEST_WORKERS>1
+    # trades comparable timings for a faster run.
+    num_workers = max(1, min(int(os.environ.get("MODEL_TEST_WORKERS", "1")), len(models_to_test)))
+    threads_per_worker = max(1, (os.cpu_count() or 1) // num_workers)
+    if num_workers > 1:
+        print(f"⚠️  Testing {num_workers} models at once; timings include contention")
     
-    # Save results
-    output_file = Path(__file__).parent.parent / "data" / "model_comparison_results.json"
-    output_file.parent.mkdir(exist_ok=True)
+    # Keep only the summary fields in memory; per-case outputs go to disk
+    all_results = []
     
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        # A fresh process per model, so only one model is resident at a time
+        max_tasks_per_child=1,
+        initializer=_init_worker,
+        initargs=(threads_per_worker,),
+    ) as executor, open(output_file, 'w') as f:
+        for result in executor.map(
+            test_model_performance,
+            models_to_test,
+            [test_cases] * len(models_to_test),
+        ):
+            f.write(json.dumps(result) + "\n")
+            f.flush()
+            result.pop("results", None)
+            all_results.append(result)
     
     print(f"\n💾 Results saved to: {output_file}")
     
@@ -31,7 +31,9 @@ class GrammarModelTrainer:
         try:
             print(f"Loading model from {self.model_path}...")
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_path)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_path)
+            self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                self.model_path, low_cpu_mem_usage=True
+            )
             
             # Move to device
             self.model = self.model.to(self.device)
@@ -124,34 +126,23 @@ class GrammarModelTrainer:
             inputs = [pair[0] for pair in data_pairs]
             targets = [pair[1] for pair in data_pairs]
             
-            # Tokenize inputs and targets
+            # Tokenize inputs and targets in one call without padding;
+            # DataCollatorForSeq2Seq pads each batch once and fills label
+            # padding with -100
             model_inputs = self.tokenizer(
                 inputs, 
+                text_target=targets,
                 max_length=128, 
-                truncation=True, 
-                padding=True,
-                return_tensors="pt"
+                truncation=True
             )
             
-            with self.tokenizer.as_target_tokenizer():
-                labels = self.tokenizer(
-                    targets, 
-                    max_length=128, 
-                    truncation=True, 
-                    padding=True,
-                    return_tensors="pt"
-                )
-            
             # Create dataset
             dataset_dict = {
                 'input_ids': model_inputs['input_ids'],
                 'attention_mask': model_inputs['attention_mask'],
-                'labels': labels['input_ids']
+                'labels': model_inputs['labels']
             }
             
-            # Replace padding token id with -100 (ignore in loss calculation)
-            dataset_dict['labels'][dataset_dict['labels'] == self.tokenizer.pad_token_id] = -100
-            
             dataset = Dataset.from_dict(dataset_dict)
             print(f"✅ Dataset prepared with {len(data_pairs)} samples")
             return dataset
@@ -172,6 +163,13 @@ class GrammarModelTrainer:
             print(f"   - Learning rate: {learning_rate}")
             print(f"   - Output directory: {output_dir}")
             
+            # Prefer bf16 (no loss scaling) where supported, else fp16 on GPU
+            use_cuda = torch.cuda.is_available()
+            use_bf16 = use_cuda and torch.cuda.is_bf16_supported()
+            
+            # Trade a recomputed forward pass for lower activation memory
+            self.model.gradient_checkpointing_enable()
+            
             # Training arguments
             training_args = TrainingArguments(
                 output_dir=output_dir,
@@ -190,7 +188,9 @@ class GrammarModelTrainer:
                 metric_for_best_model="eval_loss",
                 greater_is_better=False,
                 learning_rate=learning_rate,
-                fp16=torch.cuda.is_available(),  # Use mixed precision if available
+                bf16=use_bf16,
+                fp16=use_cuda and not use_bf16,  # Use mixed precision if available
+                optim="adamw_torch_fused" if use_cuda else "adamw_torch",
                 dataloader_num_workers=0,
                 remove_unused_columns=False
             )
@@ -233,6 +233,19 @@ class GrammarModelTrainer:
         try:
             print("\n🧪 Testing fine-tuned model...")
             
+            # Trainer leaves the model in training mode; disable dropout
+            self.model.eval()
+            
+            # Compile the forward pass that generate() calls on every decoding step
+            if hasattr(torch, "compile"):
+                compile_mode = (
+                    "reduce-overhead" if self.device == "cuda"
+                    else "max-autotune-no-cudagraphs"
+                )
+                self.model.forward = torch.compile(
+                    self.model.forward, mode=compile_mode, dynamic=True
+                )
+            
             for i, (incorrect, correct) in enumerate(test_samples[:5]):  # Test first 5
                 print(f"\nTest {i+1}:")
                 print(f"Original: '{incorrect}'")
@@ -242,12 +255,12 @@ class GrammarModelTrainer:
                 inputs = self.tokenizer(incorrect, return_tensors="pt", max_length=128, truncation=True)
                 inputs = {k: v.to(self.device) for k, v in inputs.items()}
                 
-                with torch.no_grad():
+                with torch.inference_mode():
                     outputs = self.model.generate(
                         **inputs,
-                        max_length=128,
-                        num_beams=4,
-                        early_stopping=True,
+                        max_new_tokens=128,
+                        num_beams=1,  # Greedy, matching the service's decoding
+                        do_sample=False,
                         no_repeat_ngram_size=2
                     )
                 
@@ -1,15 +1,39 @@
 import logging
 
+from sqlalchemy import inspect
+
 from .database import Base, engine
 
 
 def init_db():
     """Initialize database tables"""
     from .models import (  # Import models here to avoid circular imports
-        GrammarCorrection, User)
+        CORRECTIONS_FTS_TABLE, GrammarCorrection, User,
+        create_corrections_search_index)
+
+    # One catalog query is cheaper than create_all's per-table existence checks
+    existing_tables = set(inspect(engine).get_table_names())
+    if not set(Base.metadata.tables).issubset(existing_tables):
+        Base.metadata.create_all(bind=engine)
+        logging.info("Database tables initialized")
+        existing_tables = set(inspect(engine).get_table_names())
+
+    # Upgrades of an existing database only create the new tables above, so
+    # indexes and the search table of older tables are checked either way
+    with engine.begin() as connection:
+        # Databases created before an index was added to the models
+        # (create_all only builds indexes together with their tables)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
 
-    Base.metadata.create_all(bind=engine)
-    logging.info("Database tables initialized")
+        if (
+            engine.dialect.name == "sqlite"
+            and CORRECTIONS_FTS_TABLE not in existing_tables
+        ):
+            # Databases created before the search index existed
+            create_corrections_search_index(connection)
+            logging.info("Correction search index initialized")
 
 
 # Uncomment to auto-create tables when package is imported
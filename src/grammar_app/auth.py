@@ -4,26 +4,44 @@ Authentication Module
 This module handles JWT token creation, validation, and user authentication.
 """
 
+import secrets
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from config.settings import settings
 
-from .crud import get_user_by_email
+from .crud import (get_user, get_user_by_email, is_token_blacklisted,
+                   verify_password)
 from .database import get_db
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT token scheme
 security = HTTPBearer()
 
+# Claims every access token must carry
+_REQUIRED_CLAIMS = ["sub", "exp", "iss", "aud", "type"]
+
+# Payloads of tokens that already passed verification, keyed by the raw token.
+# Expiry is rechecked on every hit; revocation is the blacklist's job.
+_verified_tokens_lock = threading.Lock()
+_verified_tokens = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+# Claims identical for every access token (issuer, audience, token type)
+_STATIC_CLAIMS = {
+    "iss": settings.JWT_ISSUER,
+    "aud": settings.JWT_AUDIENCE,
+    "type": "access",
+}
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token."""
@@ -46,22 +64,19 @@ def create_user_token(user_id: int, expires_delta: Optional[timedelta] = None):
     """Create JWT access token for user (secure - uses ID instead of email)."""
     now = datetime.utcnow()
     
-    # Enhanced JWT payload with security claims
-    to_encode = {
-        "sub": str(user_id),  # Subject (user ID)
-        "iat": now,  # Issued at
-        "iss": settings.JWT_ISSUER,  # Issuer
-        "aud": settings.JWT_AUDIENCE,  # Audience
-        "type": "access",  # Token type
-        "jti": f"token_{user_id}_{int(now.timestamp())}"  # Unique token ID
-    }
-    
     if expires_delta:
         expire = now + expires_delta
     else:
         expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    # Enhanced JWT payload: static security claims plus per-token claims
+    to_encode = {
+        **_STATIC_CLAIMS,
+        "sub": str(user_id),  # Subject (user ID)
+        "iat": now,  # Issued at
+        "exp": expire,
+        "jti": secrets.token_hex(16),  # Unique, unpredictable token ID
+    }
     
     # Encode with enhanced security
     encoded_jwt = jwt.encode(
@@ -74,36 +89,31 @@ def create_user_token(user_id: int, expires_delta: Optional[timedelta] = None):
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify JWT token and return payload with enhanced security checks."""
+    with _verified_tokens_lock:
+        cached = _verified_tokens.get(token)
+    if cached is not None:
+        return dict(cached) if cached["exp"] > time.time() else None
+
     try:
-        # Decode with audience and issuer verification
+        # Decode with audience and issuer verification; PyJWT also rejects
+        # tokens missing any of the required claims in the same pass
         payload = jwt.decode(
             token, 
             settings.SECRET_KEY, 
             algorithms=[settings.ALGORITHM],
             audience=settings.JWT_AUDIENCE,
-            issuer=settings.JWT_ISSUER
+            issuer=settings.JWT_ISSUER,
+            options={"require": _REQUIRED_CLAIMS},
         )
         
-        # Additional security checks
-        user_id: str = payload.get("sub")
-        token_type: str = payload.get("type")
-        
-        if user_id is None:
-            print("❌ JWT Security: Missing subject claim")
-            return None
-            
-        if token_type != "access":
-            print("❌ JWT Security: Invalid token type")
-            return None
-            
-        # Check if token is in blacklist (future implementation)
-        # if is_token_blacklisted(payload.get("jti")):
-        #     return None
-            
-        return payload
+        if payload["type"] != "access":
+            raise jwt.InvalidTokenError("Invalid token type")
+
+        with _verified_tokens_lock:
+            _verified_tokens[token] = payload
+        return dict(payload)
         
-    except JWTError as e:
-        print(f"❌ JWT Security: Token verification failed - {e}")
+    except jwt.InvalidTokenError:
         return None
 
 
@@ -118,34 +128,26 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        token = credentials.credentials
-        payload = verify_token(token)
-        if payload is None:
-            raise credentials_exception
+    # verify_token handles decoding errors and the subject/type checks
+    payload = verify_token(credentials.credentials)
+    if payload is None:
+        raise credentials_exception
 
-        user_id: str = payload.get("sub")
-        jti: str = payload.get("jti")
-        
-        if user_id is None:
-            raise credentials_exception
-
-        # Check if token is blacklisted
-        from .crud import is_token_blacklisted
-        if is_token_blacklisted(db, jti):
-            print(f"❌ JWT Security: Token {jti} is blacklisted")
-            raise credentials_exception
-
-        # Get user by ID
-        from .crud import get_user
-        user = get_user(db, user_id=int(user_id))
-        if user is None:
-            raise credentials_exception
-
-        return user
-    except JWTError:
+    user_id: str = payload["sub"]
+    jti: str = payload.get("jti")
+
+    # Check if token is blacklisted
+    if is_token_blacklisted(db, jti):
+        print(f"❌ JWT Security: Token {jti} is blacklisted")
         raise credentials_exception
 
+    # Get user by ID
+    user = get_user(db, user_id=int(user_id))
+    if user is None:
+        raise credentials_exception
+
+    return user
+
 
 def get_current_active_user(current_user=Depends(get_current_user)):
     """Get current active user (for future use if we add user status)."""
@@ -161,11 +163,6 @@ def get_current_admin_user(current_user=Depends(get_current_user)):
     return current_user
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
-
-
 def authenticate_user(email: str, password: str, db: Session):
     """Authenticate user with email and password."""
     user = get_user_by_email(db, email=email)
@@ -4,22 +4,114 @@ CRUD Operations
 This module contains database operations for users and grammar corrections.
 """
 
+import itertools
+import math
+import threading
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 
 import bcrypt
-from sqlalchemy import and_, desc, func, or_
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import (Integer, and_, case, column, desc, func, insert, or_,
+                        select, text)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from config.settings import settings
 
 from . import models, schemas
 
+# In-process caches for the per-request auth lookups. User rows are cached as
+# plain column dicts (never as session-bound ORM objects) and re-attached to
+# the caller's session without SQL.
+_cache_lock = threading.Lock()
+_user_cache_by_id = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+_user_cache_by_uuid = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+# Revoked tokens stay revoked, so positive hits live longer than misses
+# (a miss may turn into a hit when another worker blacklists the token).
+_blacklisted_jtis = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_BLACKLIST_HIT_TTL_SECONDS,
+)
+_not_blacklisted_jtis = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_BLACKLIST_MISS_TTL_SECONDS,
+)
+_stats_cache = TTLCache(maxsize=1, ttl=settings.STATS_CACHE_TTL_SECONDS)
+# Per-user correction listings, stored as column dicts. Keys carry the user's
+# write generation, so a write makes older pages unreachable at once instead
+# of scanning the cache for them.
+_user_corrections_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.CORRECTIONS_CACHE_TTL_SECONDS,
+)
+# Only users who wrote recently have an entry, so it stays bounded. Entries
+# outlive every listing cached under them and are never evicted early, and
+# values are never reused, so an expired user falling back to 0 cannot make
+# an old page reachable again.
+_corrections_generation = TTLCache(
+    maxsize=math.inf, ttl=2 * settings.CORRECTIONS_CACHE_TTL_SECONDS
+)
+_generation_counter = itertools.count(1)
+# Writes only invalidate the listings of the worker that handled them, while
+# the totals shown with a page (user_stats) are always fresh. With several
+# workers the two would disagree, so listings are then not cached at all.
+_cache_user_corrections = settings.WORKERS <= 1
+
+
+def _cache_user(user: models.User) -> None:
+    """Store a snapshot of the user's columns in the lookup caches."""
+    data = {
+        column.key: getattr(user, column.key)
+        for column in models.User.__table__.columns
+    }
+    with _cache_lock:
+        _user_cache_by_id[user.id] = data
+        _user_cache_by_uuid[user.uuid] = data
+
+
+def _user_from_cache(db: Session, data: dict) -> models.User:
+    """Attach a cached user snapshot to the session without querying."""
+    user = models.User(**data)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def _invalidate_user(user: models.User) -> None:
+    """Drop a user from the lookup caches after it changes."""
+    with _cache_lock:
+        _user_cache_by_id.pop(user.id, None)
+        _user_cache_by_uuid.pop(user.uuid, None)
+
+
+def _invalidate_user_corrections(user_id: Optional[int]) -> None:
+    """Make cached correction listings of a user stale after a write."""
+    if user_id is None:
+        return
+    with _cache_lock:
+        _corrections_generation[user_id] = next(_generation_counter)
+
+
+def clear_caches() -> None:
+    """Empty all in-process lookup caches (e.g. between test transactions)."""
+    with _cache_lock:
+        _user_cache_by_id.clear()
+        _user_cache_by_uuid.clear()
+        _blacklisted_jtis.clear()
+        _not_blacklisted_jtis.clear()
+        _stats_cache.clear()
+        _user_corrections_cache.clear()
+        _corrections_generation.clear()
+
 
 # Password utilities
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_COST)
     return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
@@ -31,8 +123,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 # User CRUD operations
-def create_user(db: Session, user: schemas.UserCreate) -> models.User:
-    """Create a new regular user (non-admin)."""
+def create_user(db: Session, user: schemas.UserCreate) -> Optional[models.User]:
+    """Create a new regular user (non-admin).
+
+    Returns None if the email is already registered; the UNIQUE constraint
+    on email decides, so concurrent registrations cannot both succeed.
+    """
     hashed_password = hash_password(user.password)
     db_user = models.User(
         email=user.email,
@@ -41,8 +137,11 @@ def create_user(db: Session, user: schemas.UserCreate) -> models.User:
         role="user",  # Always create regular users
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return None
     return db_user
 
 
@@ -59,13 +158,29 @@ def create_admin_user(
     )
     db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
 def get_user(db: Session, user_id: int) -> Optional[models.User]:
     """Get user by ID."""
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    with _cache_lock:
+        cached = _user_cache_by_id.get(user_id)
+    if cached is not None:
+        return _user_from_cache(db, cached)
+
+    user = db.query(models.User).filter(models.User.id == user_id).first()
+    if user is not None:
+        _cache_user(user)
+    return user
+
+
+def _get_user_for_write(db: Session, user_id: int) -> Optional[models.User]:
+    """Load a user from the database (never the cache) before changing it.
+
+    A cached snapshot may describe a row another worker already changed or
+    deleted, which would turn the flush into a StaleDataError.
+    """
+    return db.get(models.User, user_id, populate_existing=True)
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
@@ -75,7 +190,15 @@ def get_user_by_email(db: Session, email: str) -> Optional[models.User]:
 
 def get_user_by_uuid(db: Session, user_uuid: str) -> Optional[models.User]:
     """Get user by UUID."""
-    return db.query(models.User).filter(models.User.uuid == user_uuid).first()
+    with _cache_lock:
+        cached = _user_cache_by_uuid.get(user_uuid)
+    if cached is not None:
+        return _user_from_cache(db, cached)
+
+    user = db.query(models.User).filter(models.User.uuid == user_uuid).first()
+    if user is not None:
+        _cache_user(user)
+    return user
 
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[models.User]:
@@ -92,17 +215,17 @@ def update_user(
     db: Session, user_id: int, user_update: schemas.UserUpdate
 ) -> Optional[models.User]:
     """Update user information."""
-    db_user = get_user(db, user_id)
+    db_user = _get_user_for_write(db, user_id)
     if not db_user:
         return None
 
-    update_data = user_update.dict(exclude_unset=True)
+    _invalidate_user(db_user)
+    update_data = user_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_user, field, value)
 
     db_user.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
@@ -110,13 +233,14 @@ def change_user_password(
     db: Session, user_id: int, current_password: str, new_password: str
 ) -> bool:
     """Change user password."""
-    db_user = get_user(db, user_id)
+    db_user = _get_user_for_write(db, user_id)
     if not db_user:
         return False
 
     if not verify_password(current_password, db_user.hashed_password):
         return False
 
+    _invalidate_user(db_user)
     db_user.hashed_password = hash_password(new_password)
     db_user.updated_at = datetime.utcnow()
     db.commit()
@@ -125,39 +249,113 @@ def change_user_password(
 
 def delete_user(db: Session, user_id: int) -> bool:
     """Delete a user."""
-    db_user = get_user(db, user_id)
+    db_user = _get_user_for_write(db, user_id)
     if not db_user:
         return False
 
+    _invalidate_user(db_user)
     db.delete(db_user)
     db.commit()
     return True
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[models.User]:
-    """Get list of users with pagination."""
-    return db.query(models.User).offset(skip).limit(limit).all()
+def _newest_first_page(
+    query,
+    model,
+    before: Optional[datetime],
+    before_id: Optional[int],
+    skip: int,
+    limit: int,
+):
+    """Return one newest-first page of ``query``.
+
+    With a ``before`` cursor (the ``created_at`` of the last row already
+    seen, plus its ``id`` as ``before_id`` to break ties) the page is located
+    through the ``created_at`` index, so its cost does not grow with depth;
+    otherwise ``skip`` rows are offset.
+    """
+    if before is not None:
+        if before_id is not None:
+            # Same key as the ORDER BY, so rows sharing a timestamp survive
+            query = query.filter(
+                or_(
+                    model.created_at < before,
+                    and_(model.created_at == before, model.id < before_id),
+                )
+            )
+        else:
+            query = query.filter(model.created_at < before)
+    elif skip:
+        query = query.offset(skip)
+    return (
+        query.order_by(desc(model.created_at), desc(model.id))
+        .limit(limit)
+        .all()
+    )
+
+
+def _users_with_correction_counts(db: Session):
+    """Query ``(user, correction_count)`` rows in a single statement."""
+    if _uses_sqlite(db):
+        # Maintained by triggers on grammar_corrections (see models.UserStats)
+        return db.query(
+            models.User, func.coalesce(models.UserStats.correction_count, 0)
+        ).outerjoin(models.UserStats, models.UserStats.user_id == models.User.id)
+
+    return (
+        db.query(models.User, func.count(models.GrammarCorrection.id))
+        .outerjoin(
+            models.GrammarCorrection,
+            models.GrammarCorrection.user_id == models.User.id,
+        )
+        .group_by(models.User.id)
+    )
+
+
+def get_users(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+) -> List[models.User]:
+    """Get list of users with pagination, newest first.
+
+    Each user carries its ``total_corrections`` for the response schema.
+    """
+    rows = _newest_first_page(
+        _users_with_correction_counts(db),
+        models.User,
+        before,
+        before_id,
+        skip,
+        limit,
+    )
+    users = []
+    for user, correction_count in rows:
+        user.total_corrections = correction_count
+        users.append(user)
+    return users
 
 
 def get_user_count(db: Session) -> int:
     """Get total number of users."""
-    return db.query(models.User).count()
+    return db.query(func.count(models.User.id)).scalar()
 
 
 def get_user_with_correction_count(
     db: Session, user_id: int
 ) -> Optional[Tuple[models.User, int]]:
     """Get user with their correction count."""
-    user = get_user(db, user_id)
-    if not user:
-        return None
-
-    correction_count = (
-        db.query(models.GrammarCorrection)
-        .filter(models.GrammarCorrection.user_id == user_id)
-        .count()
+    row = (
+        _users_with_correction_counts(db)
+        .filter(models.User.id == user_id)
+        .first()
     )
+    if not row:
+        return None
 
+    user, correction_count = row
     return user, correction_count
 
 
@@ -171,47 +369,86 @@ def create_correction(
     )
     db.add(db_correction)
     db.commit()
-    db.refresh(db_correction)
+    _invalidate_user_corrections(user_id)
     return db_correction
 
 
+def create_corrections_bulk(db: Session, rows: List[dict]) -> None:
+    """Insert many grammar correction records in one transaction.
+
+    Each row is a dict with ``original_text``, ``corrected_text`` and
+    optionally ``user_id``.
+    """
+    if not rows:
+        return
+    db.execute(insert(models.GrammarCorrection), rows)
+    db.commit()
+    for user_id in {row.get("user_id") for row in rows}:
+        _invalidate_user_corrections(user_id)
+
+
 def get_correction(
     db: Session, correction_id: int
 ) -> Optional[models.GrammarCorrection]:
-    """Get grammar correction by ID."""
-    return (
-        db.query(models.GrammarCorrection)
-        .filter(models.GrammarCorrection.id == correction_id)
-        .first()
-    )
+    """Get grammar correction by ID (identity map first, then SQL)."""
+    return db.get(models.GrammarCorrection, correction_id)
 
 
 def get_corrections(
-    db: Session, skip: int = 0, limit: int = 100
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
 ) -> List[models.GrammarCorrection]:
     """Get list of grammar corrections with pagination."""
-    return (
-        db.query(models.GrammarCorrection)
-        .order_by(desc(models.GrammarCorrection.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(models.GrammarCorrection)
+    return _newest_first_page(
+        query, models.GrammarCorrection, before, before_id, skip, limit
+    )
+
+
+def _uses_sqlite(db: Session) -> bool:
+    """Whether the session is bound to SQLite (FTS5 and trigger-backed paths)."""
+    return db.get_bind().dialect.name == "sqlite"
+
+
+def _text_search_filter(db: Session, query: str):
+    """Build a substring-match filter over correction text.
+
+    On SQLite, queries of three or more characters use the FTS5 trigram
+    index; shorter queries and other backends fall back to LIKE.
+    """
+    if _uses_sqlite(db) and len(query) >= 3:
+        fts = models.CORRECTIONS_FTS_TABLE
+        # Quote as an FTS phrase so user input is matched literally
+        phrase = '"' + query.replace('"', '""') + '"'
+        matching_ids = text(
+            f"SELECT rowid FROM {fts} WHERE {fts} MATCH :phrase"
+        ).bindparams(phrase=phrase).columns(column("rowid", Integer))
+        return models.GrammarCorrection.id.in_(matching_ids)
+
+    return or_(
+        models.GrammarCorrection.original_text.contains(query),
+        models.GrammarCorrection.corrected_text.contains(query),
     )
 
 
 def search_corrections(
-    db: Session, query: str, skip: int = 0, limit: int = 100
+    db: Session,
+    query: str,
+    skip: int = 0,
+    limit: int = 100,
+    user_id: Optional[int] = None,
 ) -> List[models.GrammarCorrection]:
-    """Search grammar corrections by text."""
+    """Search grammar corrections by text, optionally for one user only."""
+    db_query = db.query(models.GrammarCorrection).filter(
+        _text_search_filter(db, query)
+    )
+    if user_id is not None:
+        db_query = db_query.filter(models.GrammarCorrection.user_id == user_id)
     return (
-        db.query(models.GrammarCorrection)
-        .filter(
-            or_(
-                models.GrammarCorrection.original_text.contains(query),
-                models.GrammarCorrection.corrected_text.contains(query),
-            )
-        )
-        .order_by(desc(models.GrammarCorrection.created_at))
+        db_query.order_by(desc(models.GrammarCorrection.created_at))
         .offset(skip)
         .limit(limit)
         .all()
@@ -231,18 +468,22 @@ def get_recent_corrections(
 
 
 def get_corrections_by_date_range(
-    db: Session, start_date: datetime, end_date: datetime
+    db: Session,
+    start_date: datetime,
+    end_date: datetime,
+    user_id: Optional[int] = None,
 ) -> List[models.GrammarCorrection]:
-    """Get grammar corrections within a date range."""
-    return (
-        db.query(models.GrammarCorrection)
-        .filter(
-            and_(
-                models.GrammarCorrection.created_at >= start_date,
-                models.GrammarCorrection.created_at <= end_date,
-            )
+    """Get grammar corrections within a date range, optionally for one user."""
+    db_query = db.query(models.GrammarCorrection).filter(
+        and_(
+            models.GrammarCorrection.created_at >= start_date,
+            models.GrammarCorrection.created_at <= end_date,
         )
-        .order_by(desc(models.GrammarCorrection.created_at))
+    )
+    if user_id is not None:
+        db_query = db_query.filter(models.GrammarCorrection.user_id == user_id)
+    return (
+        db_query.order_by(desc(models.GrammarCorrection.created_at))
         .all()
     )
 
@@ -255,88 +496,148 @@ def delete_correction(db: Session, correction_id: int) -> bool:
 
     db.delete(db_correction)
     db.commit()
+    _invalidate_user_corrections(db_correction.user_id)
     return True
 
 
 def get_user_corrections(
-    db: Session, user_id: int, skip: int = 0, limit: int = 100
+    db: Session,
+    user_id: int, skip: int = 0,
+    limit: int = 100,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
 ) -> List[models.GrammarCorrection]:
-    """Get corrections by user ID."""
-    return (
-        db.query(models.GrammarCorrection)
-        .filter(models.GrammarCorrection.user_id == user_id)
-        .order_by(desc(models.GrammarCorrection.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
+    """Get corrections by user ID (served from a short-lived cache)."""
+    query = db.query(models.GrammarCorrection).filter(
+        models.GrammarCorrection.user_id == user_id
     )
+    if not _cache_user_corrections:
+        return _newest_first_page(
+            query, models.GrammarCorrection, before, before_id, skip, limit
+        )
+
+    with _cache_lock:
+        key = (
+            user_id,
+            _corrections_generation.get(user_id, 0),
+            skip,
+            limit,
+            before,
+            before_id,
+        )
+        cached = _user_corrections_cache.get(key)
+    if cached is not None:
+        corrections = [models.GrammarCorrection(**data) for data in cached]
+        for correction in corrections:
+            make_transient_to_detached(correction)
+        return corrections
+
+    corrections = _newest_first_page(
+        query, models.GrammarCorrection, before, before_id, skip, limit
+    )
+    columns = models.GrammarCorrection.__table__.columns
+    snapshot = [
+        {column.key: getattr(correction, column.key) for column in columns}
+        for correction in corrections
+    ]
+    with _cache_lock:
+        _user_corrections_cache[key] = snapshot
+    return corrections
 
 
 def get_correction_count_by_user(db: Session, user_id: int) -> int:
     """Get correction count for a specific user."""
+    if _uses_sqlite(db):
+        # Maintained by triggers on grammar_corrections (see models.UserStats)
+        count = (
+            db.query(models.UserStats.correction_count)
+            .filter(models.UserStats.user_id == user_id)
+            .scalar()
+        )
+        return count or 0
+
     return (
-        db.query(models.GrammarCorrection)
+        db.query(func.count(models.GrammarCorrection.id))
         .filter(models.GrammarCorrection.user_id == user_id)
-        .count()
+        .scalar()
     )
 
 
 def get_all_corrections(
-    db: Session, skip: int = 0, limit: int = 100
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
 ) -> List[models.GrammarCorrection]:
     """Get all corrections across all users (admin only)."""
-    return (
-        db.query(models.GrammarCorrection)
-        .order_by(desc(models.GrammarCorrection.created_at))
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(models.GrammarCorrection)
+    return _newest_first_page(
+        query, models.GrammarCorrection, before, before_id, skip, limit
     )
 
 
 def get_total_correction_count(db: Session) -> int:
     """Get total number of corrections across all users."""
-    return db.query(models.GrammarCorrection).count()
+    return db.query(func.count(models.GrammarCorrection.id)).scalar()
 
 
 # Statistics and analytics
 def get_database_stats(db: Session) -> dict:
-    """Get database statistics."""
-    today = datetime.utcnow().date()
-    today_start = datetime.combine(today, datetime.min.time())
-    today_end = datetime.combine(today, datetime.max.time())
+    """Get database statistics (cached briefly; dashboards poll this)."""
+    with _cache_lock:
+        cached = _stats_cache.get("stats")
+    if cached is not None:
+        return dict(cached)
 
-    total_corrections = db.query(models.GrammarCorrection).count()
-    total_users = db.query(models.User).count()
-
-    corrections_today = (
-        db.query(models.GrammarCorrection)
-        .filter(
-            and_(
-                models.GrammarCorrection.created_at >= today_start,
-                models.GrammarCorrection.created_at <= today_end,
+    # Half-open [today_start, today_end) range for index range scans
+    now = datetime.utcnow()
+    today_start = datetime(now.year, now.month, now.day)
+    today_end = today_start + timedelta(days=1)
+
+    # One pass per table: total rows plus a conditional count for today
+    total_corrections, corrections_today = db.query(
+        func.count(models.GrammarCorrection.id),
+        func.sum(
+            case(
+                (
+                    and_(
+                        models.GrammarCorrection.created_at >= today_start,
+                        models.GrammarCorrection.created_at < today_end,
+                    ),
+                    1,
+                ),
+                else_=0,
             )
-        )
-        .count()
-    )
-
-    users_today = (
-        db.query(models.User)
-        .filter(
-            and_(
-                models.User.created_at >= today_start,
-                models.User.created_at <= today_end,
+        ),
+    ).one()
+
+    total_users, users_today = db.query(
+        func.count(models.User.id),
+        func.sum(
+            case(
+                (
+                    and_(
+                        models.User.created_at >= today_start,
+                        models.User.created_at < today_end,
+                    ),
+                    1,
+                ),
+                else_=0,
             )
-        )
-        .count()
-    )
+        ),
+    ).one()
 
-    return {
+    stats = {
         "total_corrections": total_corrections,
         "total_users": total_users,
-        "corrections_today": corrections_today,
-        "users_today": users_today,
+        # SUM over an empty table is NULL
+        "corrections_today": corrections_today or 0,
+        "users_today": users_today or 0,
     }
+    with _cache_lock:
+        _stats_cache["stats"] = stats
+    return dict(stats)
 
 
 def blacklist_token(db: Session, jti: str, user_id: int, expires_at: datetime) -> models.TokenBlacklist:
@@ -348,23 +649,48 @@ def blacklist_token(db: Session, jti: str, user_id: int, expires_at: datetime) -
     )
     db.add(blacklisted_token)
     db.commit()
-    db.refresh(blacklisted_token)
+    with _cache_lock:
+        _not_blacklisted_jtis.pop(jti, None)
+        _blacklisted_jtis[jti] = True
     return blacklisted_token
 
 
 def is_token_blacklisted(db: Session, jti: str) -> bool:
     """Check if a token is blacklisted."""
-    blacklisted = db.query(models.TokenBlacklist).filter(
-        models.TokenBlacklist.jti == jti
-    ).first()
-    return blacklisted is not None
-
-
-def cleanup_expired_tokens(db: Session) -> int:
-    """Remove expired tokens from blacklist."""
+    with _cache_lock:
+        if jti in _blacklisted_jtis:
+            return True
+        if jti in _not_blacklisted_jtis:
+            return False
+
+    # EXISTS is answered from the jti index without loading the row
+    blacklisted = db.query(
+        db.query(models.TokenBlacklist.id)
+        .filter(models.TokenBlacklist.jti == jti)
+        .exists()
+    ).scalar()
+    with _cache_lock:
+        if blacklisted:
+            _blacklisted_jtis[jti] = True
+        else:
+            _not_blacklisted_jtis[jti] = True
+    return bool(blacklisted)
+
+
+def cleanup_expired_tokens(db: Session, batch_size: Optional[int] = None) -> int:
+    """Remove expired tokens from blacklist.
+
+    With ``batch_size`` at most that many rows are deleted, keeping each
+    write transaction short; call repeatedly to drain a large backlog.
+    """
     now = datetime.utcnow()
-    expired_tokens = db.query(models.TokenBlacklist).filter(
-        models.TokenBlacklist.expires_at < now
-    ).delete()
+    expired = models.TokenBlacklist.expires_at < now
+    if batch_size is not None:
+        expired = models.TokenBlacklist.id.in_(
+            select(models.TokenBlacklist.id).where(expired).limit(batch_size)
+        )
+    expired_tokens = db.query(models.TokenBlacklist).filter(expired).delete(
+        synchronize_session=False
+    )
     db.commit()
     return expired_tokens
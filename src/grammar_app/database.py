@@ -6,7 +6,7 @@ This module handles database connection and session management.
 
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from config.settings import settings
@@ -16,14 +16,53 @@ from .base import Base
 # Use database URL from settings
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-# Create database engine with SQLite
+_is_sqlite = SQLALCHEMY_DATABASE_URL.startswith("sqlite")
+
+# The pool is sized for the threadpool that runs the sync route handlers
+# (in-memory SQLite uses a per-thread pool that takes no sizing)
+_pool_options = {}
+if ":memory:" not in SQLALCHEMY_DATABASE_URL:
+    _pool_options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+# Create database engine
 # check_same_thread=False is only needed for SQLite
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    pool_pre_ping=not _is_sqlite,
+    **_pool_options,
 )
 
-# Session factory - each request gets its own session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune each new SQLite connection for concurrent API traffic.
+
+        WAL lets readers (e.g. token blacklist checks) run alongside a writer,
+        synchronous=NORMAL only fsyncs at checkpoints, and mmap serves reads
+        straight from the page cache.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+
+# Session factory - each request gets its own session. Objects are not
+# expired on commit: rows are written with client-side defaults, so a freshly
+# committed object is already complete and needs no reload SELECT.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 # Dependency to get DB session
@@ -5,23 +5,32 @@ This is the main entry point for Pratik's Grammar Correction API.
 It initializes the FastAPI application and includes all route modules.
 """
 
+import asyncio
+import threading
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config.settings import settings
 
-from .database import Base, engine
+from . import init_db
+from .crud import cleanup_expired_tokens
+from .database import SessionLocal
 from .routes import (analytics_router, database_router, grammar_router,
                      system_router, users_router)
+from .services import get_grammar_service
 
 # Create database tables
-Base.metadata.create_all(bind=engine)
+init_db()
 
 # Initialize FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
     contact={
         "name": settings.DEVELOPER_NAME,
         "url": settings.DEVELOPER_LINKEDIN,
@@ -72,3 +81,48 @@ app.include_router(users_router)
 app.include_router(database_router)
 app.include_router(analytics_router)
 app.include_router(system_router)
+
+
+def _purge_expired_tokens() -> int:
+    """Delete expired blacklist entries in bounded batches."""
+    db = SessionLocal()
+    try:
+        total = 0
+        while True:
+            deleted = cleanup_expired_tokens(
+                db, batch_size=settings.TOKEN_CLEANUP_BATCH_SIZE
+            )
+            total += deleted
+            if deleted < settings.TOKEN_CLEANUP_BATCH_SIZE:
+                return total
+    finally:
+        db.close()
+
+
+async def _token_cleanup_loop():
+    """Periodically purge expired tokens so the blacklist index stays small."""
+    while True:
+        await asyncio.sleep(settings.TOKEN_CLEANUP_INTERVAL_SECONDS)
+        try:
+            await run_in_threadpool(_purge_expired_tokens)
+        except Exception as e:
+            print(f"Token cleanup failed: {e}")
+
+
+@app.on_event("startup")
+async def start_token_cleanup():
+    """Start the background token cleanup task."""
+    app.state.token_cleanup_task = asyncio.create_task(_token_cleanup_loop())
+
+
+@app.on_event("startup")
+async def preload_grammar_model():
+    """Load the grammar model in the background so the first request is fast."""
+    if settings.MODEL_PRELOAD:
+        threading.Thread(target=get_grammar_service, daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def stop_token_cleanup():
+    """Stop the background token cleanup task."""
+    app.state.token_cleanup_task.cancel()
@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import (Column, DateTime, ForeignKey, Index, Integer, String,
-                        Text, func)
+                        Text, event, func)
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -19,15 +19,14 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     uuid = Column(
         String(36),
         unique=True,
-        index=True,
         nullable=False,
         default=lambda: str(uuid.uuid4()),
     )
-    email = Column(String(255), unique=True, index=True, nullable=False)
+    email = Column(String(255), unique=True, nullable=False)
     full_name = Column(String(255), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     role = Column(String(50), default="user", nullable=False)  # "admin" or "user"
@@ -38,9 +37,8 @@ class User(Base):
     corrections = relationship("GrammarCorrection", back_populates="user")
     blacklisted_tokens = relationship("TokenBlacklist", back_populates="user")
 
+    # email and uuid are already indexed by their UNIQUE constraints
     __table_args__ = (
-        Index("idx_user_email", "email"),
-        Index("idx_user_uuid", "uuid"),
         Index("idx_user_created_at", "created_at"),
         Index("idx_user_role", "role"),
     )
@@ -51,7 +49,7 @@ class GrammarCorrection(Base):
 
     __tablename__ = "grammar_corrections"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     original_text = Column(Text, nullable=False)
     corrected_text = Column(Text, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -62,18 +60,123 @@ class GrammarCorrection(Base):
     user = relationship("User", back_populates="corrections")
 
     __table_args__ = (
-        Index("idx_correction_user_id", "user_id"),
+        # Serves per-user lookups and per-user newest-first listings
+        Index("idx_correction_user_created_at", "user_id", "created_at"),
         Index("idx_correction_created_at", "created_at"),
-        Index("idx_correction_text", "original_text", "corrected_text"),
     )
 
 
+# SQLite FTS5 index over correction text. The trigram tokenizer keeps the
+# substring semantics of LIKE '%q%' while answering from an inverted index.
+CORRECTIONS_FTS_TABLE = "grammar_corrections_fts"
+
+_CORRECTIONS_FTS_DDL = (
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {CORRECTIONS_FTS_TABLE} USING fts5(
+        original_text, corrected_text,
+        content='grammar_corrections', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {CORRECTIONS_FTS_TABLE}_ai
+    AFTER INSERT ON grammar_corrections BEGIN
+        INSERT INTO {CORRECTIONS_FTS_TABLE}(rowid, original_text, corrected_text)
+        VALUES (new.id, new.original_text, new.corrected_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {CORRECTIONS_FTS_TABLE}_ad
+    AFTER DELETE ON grammar_corrections BEGIN
+        INSERT INTO {CORRECTIONS_FTS_TABLE}(
+            {CORRECTIONS_FTS_TABLE}, rowid, original_text, corrected_text
+        ) VALUES ('delete', old.id, old.original_text, old.corrected_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {CORRECTIONS_FTS_TABLE}_au
+    AFTER UPDATE ON grammar_corrections BEGIN
+        INSERT INTO {CORRECTIONS_FTS_TABLE}(
+            {CORRECTIONS_FTS_TABLE}, rowid, original_text, corrected_text
+        ) VALUES ('delete', old.id, old.original_text, old.corrected_text);
+        INSERT INTO {CORRECTIONS_FTS_TABLE}(rowid, original_text, corrected_text)
+        VALUES (new.id, new.original_text, new.corrected_text);
+    END""",
+    # Backfill from rows that existed before the index
+    f"INSERT INTO {CORRECTIONS_FTS_TABLE}({CORRECTIONS_FTS_TABLE}) VALUES ('rebuild')",
+)
+
+
+def create_corrections_search_index(connection):
+    """Create (and backfill) the FTS5 search index on SQLite databases."""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in _CORRECTIONS_FTS_DDL:
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(GrammarCorrection.__table__, "after_create")
+def _create_search_index_after_table(target, connection, **kw):
+    create_corrections_search_index(connection)
+
+
+@event.listens_for(GrammarCorrection.__table__, "before_drop")
+def _drop_search_index_before_table(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {CORRECTIONS_FTS_TABLE}")
+
+
+class UserStats(Base):
+    """Per-user correction counters maintained by database triggers."""
+
+    __tablename__ = "user_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    correction_count = Column(Integer, default=0, nullable=False)
+
+
+# SQLite triggers keeping user_stats in step with grammar_corrections, so a
+# user's correction count is a primary-key lookup instead of COUNT(*).
+_USER_STATS_DDL = (
+    """CREATE TRIGGER IF NOT EXISTS user_stats_correction_ai
+    AFTER INSERT ON grammar_corrections WHEN new.user_id IS NOT NULL BEGIN
+        INSERT INTO user_stats(user_id, correction_count) VALUES (new.user_id, 1)
+        ON CONFLICT(user_id) DO UPDATE SET correction_count = correction_count + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS user_stats_correction_ad
+    AFTER DELETE ON grammar_corrections WHEN old.user_id IS NOT NULL BEGIN
+        UPDATE user_stats SET correction_count = correction_count - 1
+        WHERE user_id = old.user_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS user_stats_correction_au
+    AFTER UPDATE OF user_id ON grammar_corrections
+    WHEN old.user_id IS NOT new.user_id BEGIN
+        UPDATE user_stats SET correction_count = correction_count - 1
+        WHERE user_id = old.user_id;
+        INSERT INTO user_stats(user_id, correction_count)
+        SELECT new.user_id, 1 WHERE new.user_id IS NOT NULL
+        ON CONFLICT(user_id) DO UPDATE SET correction_count = correction_count + 1;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS user_stats_user_ad
+    AFTER DELETE ON users BEGIN
+        DELETE FROM user_stats WHERE user_id = old.id;
+    END""",
+)
+
+# Backfill counters for corrections that predate the user_stats table
+_USER_STATS_BACKFILL = """INSERT OR REPLACE INTO user_stats(user_id, correction_count)
+    SELECT user_id, COUNT(*) FROM grammar_corrections
+    WHERE user_id IS NOT NULL GROUP BY user_id"""
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_user_stats_triggers(target, connection, tables=(), **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in _USER_STATS_DDL:
+        connection.exec_driver_sql(statement)
+    if UserStats.__table__ in tables:
+        connection.exec_driver_sql(_USER_STATS_BACKFILL)
+
+
 class TokenBlacklist(Base):
     """Model for tracking revoked JWT tokens."""
     __tablename__ = "token_blacklist"
     
-    id = Column(Integer, primary_key=True, index=True)
-    jti = Column(String(255), unique=True, index=True, nullable=False)  # JWT ID
+    id = Column(Integer, primary_key=True)
+    jti = Column(String(255), unique=True, nullable=False)  # JWT ID
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     expires_at = Column(DateTime, nullable=False)
@@ -82,7 +185,7 @@ class TokenBlacklist(Base):
     user = relationship("User", back_populates="blacklisted_tokens")
     
     __table_args__ = (
-        Index('idx_token_blacklist_jti', 'jti'),
         Index('idx_token_blacklist_user_id', 'user_id'),
         Index('idx_token_blacklist_expires_at', 'expires_at'),
+        Index('idx_token_blacklist_jti_expires_at', 'jti', 'expires_at'),
     )
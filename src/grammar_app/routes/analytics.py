@@ -4,7 +4,8 @@ Analytics Routes
 This module contains statistics and reporting endpoints.
 """
 
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
@@ -26,7 +27,7 @@ router = APIRouter(
     summary="Get database statistics",
     description="Get comprehensive statistics about the database (admin only)",
 )
-async def get_database_stats(
+def get_database_stats(
     current_user=Depends(get_current_admin_user), db: Session = Depends(get_db)
 ):
     """Get database statistics (admin only)."""
@@ -38,9 +39,7 @@ async def get_database_stats(
     summary="Get current user statistics",
     description="Get statistics for the currently authenticated user",
 )
-async def get_my_stats(
-    current_user=Depends(get_current_user), db: Session = Depends(get_db)
-):
+def get_my_stats(current_user=Depends(get_current_user), db: Session = Depends(get_db)):
     """Get statistics for the current user."""
     correction_count = crud.get_correction_count_by_user(db, current_user.id)
 
@@ -59,13 +58,27 @@ async def get_my_stats(
     summary="Get current user corrections",
     description="Get all corrections made by the currently authenticated user",
 )
-async def get_my_corrections(
+def get_my_corrections(
     limit: int = Query(50, ge=1, le=100, description="Number of corrections"),
+    before: Optional[datetime] = Query(
+        None,
+        description="Keyset cursor: only return items created before this timestamp",
+    ),
+    before_id: Optional[int] = Query(
+        None,
+        description="Keyset cursor tiebreaker: id of the last item seen (with before)",
+    ),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get corrections for the current user."""
-    return crud.get_user_corrections(db, user_id=current_user.id, limit=limit)
+    return crud.get_user_corrections(
+        db,
+        user_id=current_user.id,
+        limit=limit,
+        before=before,
+        before_id=before_id,
+    )
 
 
 @router.get(
@@ -73,7 +86,7 @@ async def get_my_corrections(
     summary="Get current user correction count",
     description="Get the total number of corrections made by the current user",
 )
-async def get_my_correction_count(
+def get_my_correction_count(
     current_user=Depends(get_current_user), db: Session = Depends(get_db)
 ):
     """Get correction count for the current user."""
@@ -88,9 +101,17 @@ async def get_my_correction_count(
     summary="Get any user corrections (admin only)",
     description="Get all corrections made by a specific user (admin only)",
 )
-async def get_any_user_corrections_admin(
+def get_any_user_corrections_admin(
     user_uuid: str,
     limit: int = Query(50, ge=1, le=100, description="Number of corrections"),
+    before: Optional[datetime] = Query(
+        None,
+        description="Keyset cursor: only return items created before this timestamp",
+    ),
+    before_id: Optional[int] = Query(
+        None,
+        description="Keyset cursor tiebreaker: id of the last item seen (with before)",
+    ),
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
@@ -100,7 +121,9 @@ async def get_any_user_corrections_admin(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return crud.get_user_corrections(db, user_id=user.id, limit=limit)
+    return crud.get_user_corrections(
+        db, user_id=user.id, limit=limit, before=before, before_id=before_id
+    )
 
 
 @router.get(
@@ -108,7 +131,7 @@ async def get_any_user_corrections_admin(
     summary="Get any user correction count (admin only)",
     description="Get the total number of corrections made by a user (admin only)",
 )
-async def get_any_user_correction_count_admin(
+def get_any_user_correction_count_admin(
     user_uuid: str,
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
@@ -4,10 +4,10 @@ Database Operation Routes
 This module contains CRUD operations for grammar corrections with search and filtering.
 """
 
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, time
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from .. import crud, schemas
@@ -27,51 +27,51 @@ router = APIRouter(
     summary="List corrections",
     description="Get paginated list of grammar corrections. Returns user's own corrections when authenticated.",
 )
-async def list_corrections(
+def list_corrections(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    before: Optional[datetime] = Query(
+        None,
+        description=(
+            "Keyset cursor: only return items created before this timestamp"
+            " (overrides page)"
+        ),
+    ),
+    before_id: Optional[int] = Query(
+        None,
+        description="Keyset cursor tiebreaker: id of the last item seen (with before)",
+    ),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get paginated list of grammar corrections for the authenticated user."""
     skip = (page - 1) * per_page
     corrections = crud.get_user_corrections(
-        db, user_id=current_user.id, skip=skip, limit=per_page
+        db,
+        user_id=current_user.id,
+        skip=skip,
+        limit=per_page,
+        before=before,
+        before_id=before_id,
     )
     total = crud.get_correction_count_by_user(db, current_user.id)
 
-    return {
-        "corrections": corrections,
-        "total": total,
-        "page": page,
-        "per_page": per_page,
-    }
-
-
-@router.get(
-    "/{correction_id}",
-    response_model=schemas.GrammarCorrectionResponse,
-    summary="Get correction by ID",
-    description="Retrieve a specific grammar correction by ID (user can only access their own corrections)",
-)
-async def get_correction(
-    correction_id: int,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
-):
-    """Get grammar correction by ID (user can only access their own corrections)."""
-    correction = crud.get_correction(db, correction_id=correction_id)
-    if correction is None:
-        raise HTTPException(status_code=404, detail="Correction not found")
-
-    # Ensure user can only access their own corrections
-    if correction.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403,
-            detail="Access denied: You can only view your own corrections",
-        )
-
-    return correction
+    # Last row of a full page; its (created_at, id) is the next page's cursor
+    last = corrections[-1] if len(corrections) == per_page else None
+
+    # Validate and serialize in one pass; FastAPI skips re-validating a Response
+    payload = schemas.GrammarCorrectionList.model_validate(
+        {
+            "corrections": corrections,
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": last.created_at if last else None,
+            "next_cursor_id": last.id if last else None,
+        },
+        from_attributes=True,
+    )
+    return Response(payload.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -80,7 +80,7 @@ async def get_correction(
     summary="Get recent corrections",
     description="Get the most recent grammar corrections for the authenticated user",
 )
-async def get_recent_corrections(
+def get_recent_corrections(
     limit: int = Query(10, ge=1, le=50, description="Number of recent corrections"),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -95,7 +95,7 @@ async def get_recent_corrections(
     summary="Search corrections",
     description="Search grammar corrections by text content (user's own corrections only)",
 )
-async def search_corrections(
+def search_corrections(
     query: str = Query(..., description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -104,12 +104,9 @@ async def search_corrections(
 ):
     """Search grammar corrections by text (user's own corrections only)."""
     skip = (page - 1) * per_page
-    # Note: This would need to be updated in CRUD to filter by user_id
-    corrections = crud.search_corrections(db, query=query, skip=skip, limit=per_page)
-
-    # Filter to only user's corrections
-    user_corrections = [c for c in corrections if c.user_id == current_user.id]
-    return user_corrections
+    return crud.search_corrections(
+        db, query=query, skip=skip, limit=per_page, user_id=current_user.id
+    )
 
 
 @router.get(
@@ -118,29 +115,47 @@ async def search_corrections(
     summary="Get corrections by date range",
     description="Get grammar corrections within a specific date range (user's own corrections only)",
 )
-async def get_corrections_by_date_range(
-    start_date: str = Query(..., description="Start date (YYYY-MM-DD)"),
-    end_date: str = Query(..., description="End date (YYYY-MM-DD)"),
+def get_corrections_by_date_range(
+    start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Get grammar corrections within a date range (user's own corrections only)."""
-    try:
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-    except ValueError:
-        raise HTTPException(
-            status_code=400, detail="Invalid date format. Use YYYY-MM-DD"
-        )
+    # created_at is a DATETIME column; compare against midnight of each date
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date, time.min)
 
-    # Note: This would need to be updated in CRUD to filter by user_id
-    all_corrections = crud.get_corrections_by_date_range(
-        db, start_date=start, end_date=end
+    return crud.get_corrections_by_date_range(
+        db, start_date=start, end_date=end, user_id=current_user.id
     )
 
-    # Filter to only user's corrections
-    user_corrections = [c for c in all_corrections if c.user_id == current_user.id]
-    return user_corrections
+
+# Registered after the fixed paths above so it does not shadow them
+@router.get(
+    "/{correction_id}",
+    response_model=schemas.GrammarCorrectionResponse,
+    summary="Get correction by ID",
+    description="Retrieve a specific grammar correction by ID (user can only access their own corrections)",
+)
+def get_correction(
+    correction_id: int,
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Get grammar correction by ID (user can only access their own corrections)."""
+    correction = crud.get_correction(db, correction_id=correction_id)
+    if correction is None:
+        raise HTTPException(status_code=404, detail="Correction not found")
+
+    # Ensure user can only access their own corrections
+    if correction.user_id != current_user.id:
+        raise HTTPException(
+            status_code=403,
+            detail="Access denied: You can only view your own corrections",
+        )
+
+    return correction
 
 
 @router.delete(
@@ -148,7 +163,7 @@ async def get_corrections_by_date_range(
     summary="Delete correction",
     description="Delete a specific grammar correction (user can only delete their own corrections)",
 )
-async def delete_correction(
+def delete_correction(
     correction_id: int,
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -178,42 +193,44 @@ async def delete_correction(
     summary="List all corrections (admin only)",
     description="Get paginated list of all grammar corrections across all users (admin only)",
 )
-async def list_all_corrections_admin(
+def list_all_corrections_admin(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    before: Optional[datetime] = Query(
+        None,
+        description=(
+            "Keyset cursor: only return items created before this timestamp"
+            " (overrides page)"
+        ),
+    ),
+    before_id: Optional[int] = Query(
+        None,
+        description="Keyset cursor tiebreaker: id of the last item seen (with before)",
+    ),
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Get paginated list of all grammar corrections (admin only)."""
     skip = (page - 1) * per_page
-    corrections = crud.get_all_corrections(db, skip=skip, limit=per_page)
+    corrections = crud.get_all_corrections(
+        db, skip=skip, limit=per_page, before=before, before_id=before_id
+    )
     total = crud.get_total_correction_count(db)
 
-    return {
-        "corrections": corrections,
-        "total": total,
-        "page": page,
-        "per_page": per_page,
-    }
-
-
-@router.get(
-    "/admin/{correction_id}",
-    response_model=schemas.GrammarCorrectionResponse,
-    summary="Get any correction by ID (admin only)",
-    description="Retrieve any grammar correction by ID (admin only)",
-)
-async def get_any_correction_admin(
-    correction_id: int,
-    current_user=Depends(get_current_admin_user),
-    db: Session = Depends(get_db),
-):
-    """Get any grammar correction by ID (admin only)."""
-    correction = crud.get_correction(db, correction_id=correction_id)
-    if correction is None:
-        raise HTTPException(status_code=404, detail="Correction not found")
-
-    return correction
+    # Last row of a full page; its (created_at, id) is the next page's cursor
+    last = corrections[-1] if len(corrections) == per_page else None
+    payload = schemas.GrammarCorrectionList.model_validate(
+        {
+            "corrections": corrections,
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": last.created_at if last else None,
+            "next_cursor_id": last.id if last else None,
+        },
+        from_attributes=True,
+    )
+    return Response(payload.model_dump_json(), media_type="application/json")
 
 
 @router.delete(
@@ -221,7 +238,7 @@ async def get_any_correction_admin(
     summary="Delete any correction (admin only)",
     description="Delete any grammar correction by ID (admin only)",
 )
-async def delete_any_correction_admin(
+def delete_any_correction_admin(
     correction_id: int,
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
@@ -239,7 +256,7 @@ async def delete_any_correction_admin(
     summary="Search all corrections (admin only)",
     description="Search all grammar corrections by text content (admin only)",
 )
-async def search_all_corrections_admin(
+def search_all_corrections_admin(
     query: str = Query(..., description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -250,3 +267,23 @@ async def search_all_corrections_admin(
     skip = (page - 1) * per_page
     corrections = crud.search_corrections(db, query=query, skip=skip, limit=per_page)
     return corrections
+
+
+# Registered after /admin/search so it does not shadow it
+@router.get(
+    "/admin/{correction_id}",
+    response_model=schemas.GrammarCorrectionResponse,
+    summary="Get any correction by ID (admin only)",
+    description="Retrieve any grammar correction by ID (admin only)",
+)
+def get_any_correction_admin(
+    correction_id: int,
+    current_user=Depends(get_current_admin_user),
+    db: Session = Depends(get_db),
+):
+    """Get any grammar correction by ID (admin only)."""
+    correction = crud.get_correction(db, correction_id=correction_id)
+    if correction is None:
+        raise HTTPException(status_code=404, detail="Correction not found")
+
+    return correction
@@ -4,7 +4,10 @@ Grammar Correction Routes
 This module contains the core grammar correction API endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+from typing import Callable, Iterator
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from .. import schemas
@@ -13,6 +16,8 @@ from ..crud import create_correction
 from ..database import get_db
 from ..services import correct_grammar
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/correct",
     tags=["Grammar Correction"],
@@ -20,6 +25,39 @@ router = APIRouter(
 )
 
 
+def _session_dependency(request: Request) -> Callable[[], Iterator[Session]]:
+    """The app's ``get_db`` dependency, or the override installed for it."""
+    return request.app.dependency_overrides.get(get_db, get_db)
+
+
+def _save_correction(
+    open_db: Callable[[], Iterator[Session]],
+    original_text: str,
+    corrected_text: str,
+    user_id: int,
+) -> None:
+    """Store a correction after the response has been sent.
+
+    The request's session may already be closed, so a new one is opened
+    through ``open_db`` (see ``_session_dependency``).
+    """
+    sessions = open_db()
+    db = next(sessions)
+    try:
+        create_correction(
+            db,
+            original_text=original_text,
+            corrected_text=corrected_text,
+            user_id=user_id,
+        )
+    except Exception:
+        # The client already has its response; do not lose the write silently
+        db.rollback()
+        logger.exception("Failed to save correction for user %s", user_id)
+    finally:
+        sessions.close()
+
+
 @router.post(
     "/",
     response_model=schemas.CorrectionResponse,
@@ -28,18 +66,20 @@ router = APIRouter(
     response_description="Grammar correction result with original and corrected text",
     status_code=200,
 )
-async def correct_text(
+def correct_text(
     request: schemas.TextRequest,
+    background_tasks: BackgroundTasks,
     current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    open_db=Depends(_session_dependency),
 ):
     """Correct grammar in the provided text (authenticated users only)."""
     try:
         corrected_text = correct_grammar(request.text)
 
-        # Save correction with user ID
-        create_correction(
-            db,
+        # Save correction with user ID once the response has been sent
+        background_tasks.add_task(
+            _save_correction,
+            open_db,
             original_text=request.text,
             corrected_text=corrected_text,
             user_id=current_user.id,
@@ -60,7 +100,7 @@ async def correct_text(
     response_description="Grammar correction result with original and corrected text",
     status_code=200,
 )
-async def correct_text_anonymous(request: schemas.TextRequest):
+def correct_text_anonymous(request: schemas.TextRequest):
     """Correct grammar in the provided text (anonymous users, no database storage)."""
     try:
         corrected_text = correct_grammar(request.text)
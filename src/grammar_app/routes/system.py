@@ -4,26 +4,18 @@ System Routes
 This module contains API information and system endpoints.
 """
 
-from fastapi import APIRouter
+from functools import lru_cache
 
-from config.settings import settings
-
-from ..services import get_model_info
+import orjson
+from fastapi import APIRouter, Response
 
-router = APIRouter(
-    tags=["System"],
-    responses={404: {"description": "Not found"}},
-)
+from config.settings import settings
 
+from ..services import get_model_info, is_grammar_service_ready
 
-@router.get(
-    "/",
-    summary="API Information",
-    description="Get information about the API and available endpoints",
-)
-async def root():
-    """Get API information and available endpoints."""
-    return {
+# API information never changes while the process runs; serialize it once
+_ROOT_PAYLOAD = orjson.dumps(
+    {
         "message": "🚀 Welcome to Pratik's Grammar Correction API!",
         "developer": settings.DEVELOPER_NAME,
         "version": settings.APP_VERSION,
@@ -37,15 +29,17 @@ async def root():
             "documentation": "/docs",
         },
     }
+)
 
 
-@router.get(
-    "/health",
-    summary="Health Check",
-    description="Check if the API is running and healthy",
-)
-async def health_check():
-    """Check API health status."""
+@lru_cache(maxsize=1)
+def _health_payload() -> dict:
+    """Build the health response once the grammar service has loaded.
+
+    The service loads its model a single time (in the background at startup,
+    or on first use) and never reloads it, so the model details cannot change
+    afterwards.
+    """
     model_info = get_model_info()
     return {
         "status": "healthy",
@@ -53,3 +47,37 @@ async def health_check():
         "model_name": model_info.get("model_name", "unknown"),
         "device": model_info.get("device", "unknown"),
     }
+
+
+router = APIRouter(
+    tags=["System"],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get(
+    "/",
+    summary="API Information",
+    description="Get information about the API and available endpoints",
+)
+async def root():
+    """Get API information and available endpoints."""
+    return Response(_ROOT_PAYLOAD, media_type="application/json")
+
+
+@router.get(
+    "/health",
+    summary="Health Check",
+    description="Check if the API is running and healthy",
+)
+def health_check():
+    """Check API health status."""
+    if not is_grammar_service_ready():
+        # Answer while the model is still loading instead of waiting on it
+        return {
+            "status": "healthy",
+            "model_loaded": False,
+            "model_name": settings.MODEL_NAME,
+            "device": settings.DEVICE,
+        }
+    return _health_payload()
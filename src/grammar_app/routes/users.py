@@ -4,19 +4,25 @@ User Management Routes
 This module contains user registration, authentication, and profile management endpoints.
 """
 
-from datetime import timedelta
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
 from config.settings import settings
 
 from .. import crud, schemas
 from ..auth import (authenticate_user, create_access_token, create_user_token,
-                    get_current_admin_user, get_current_user, verify_token)
+                    get_current_admin_user, get_current_user, security,
+                    verify_token)
 from ..database import get_db
 
+# Token lifetime, fixed for the process
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+ACCESS_TOKEN_EXPIRES_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
 router = APIRouter(
     prefix="/users",
     tags=["User Management"],
@@ -31,26 +37,22 @@ router = APIRouter(
     description="Create a new user account with email and password. Returns JWT token for immediate authentication.",
     status_code=201,
 )
-async def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+def register_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     """Register a new user and return JWT token."""
-    # Check if user already exists
-    db_user = crud.get_user_by_email(db, email=user.email)
-    if db_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
-    # Create user
+    # Create user; the insert itself rejects an already registered email
     created_user = crud.create_user(db=db, user=user)
+    if created_user is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create secure access token using user ID instead of email
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_user_token(
-        user_id=created_user.id, expires_delta=access_token_expires
+        user_id=created_user.id, expires_delta=ACCESS_TOKEN_EXPIRES
     )
 
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        "expires_in": ACCESS_TOKEN_EXPIRES_SECONDS,
         "user": created_user,
     }
 
@@ -61,7 +63,7 @@ async def register_user(user: schemas.UserCreate, db: Session = Depends(get_db))
     summary="User login",
     description="Authenticate user with email and password. Returns JWT token for API access.",
 )
-async def login_user(
+def login_user(
     user_credentials: schemas.UserLogin, db: Session = Depends(get_db)
 ):
     """Authenticate user and return JWT token."""
@@ -70,15 +72,14 @@ async def login_user(
         raise HTTPException(status_code=401, detail="Incorrect email or password")
 
     # Create secure access token using user ID instead of email
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_user_token(
-        user_id=user.id, expires_delta=access_token_expires
+        user_id=user.id, expires_delta=ACCESS_TOKEN_EXPIRES
     )
 
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        "expires_in": ACCESS_TOKEN_EXPIRES_SECONDS,
         "user": user,
     }
 
@@ -89,20 +90,16 @@ async def login_user(
     description="Logout user and revoke JWT token.",
     status_code=200,
 )
-async def logout_user(
+def logout_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Logout user and blacklist their token."""
     try:
-        # Get token from request
-        from fastapi import Request
-        request = Request()
-        auth_header = request.headers.get("Authorization")
-        
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-            
+        # Token from the Authorization header (already validated by get_current_user)
+        token = credentials.credentials
+        if token:
             # Decode token to get JTI
             payload = verify_token(token)
             if payload:
@@ -110,13 +107,14 @@ async def logout_user(
                 exp_timestamp = payload.get("exp")
                 
                 if jti and exp_timestamp:
-                    # Convert timestamp to datetime
-                    from datetime import datetime
-                    expires_at = datetime.fromtimestamp(exp_timestamp)
+                    # Convert timestamp to naive UTC, as the cleanup compares
+                    # with utcnow()
+                    expires_at = datetime.utcfromtimestamp(exp_timestamp)
                     
                     # Blacklist the token
-                    from ..crud import blacklist_token
-                    blacklist_token(db, jti=jti, user_id=current_user.id, expires_at=expires_at)
+                    crud.blacklist_token(
+                        db, jti=jti, user_id=current_user.id, expires_at=expires_at
+                    )
                     
                     return {"message": "Successfully logged out", "token_revoked": True}
         
@@ -133,16 +131,15 @@ async def logout_user(
     summary="Get current user profile",
     description="Get profile information for the currently authenticated user",
 )
-async def get_current_user_profile(
+def get_current_user_profile(
     current_user=Depends(get_current_user), db: Session = Depends(get_db)
 ):
     """Get current user profile."""
-    # Get correction count for current user
-    from ..crud import get_user_with_correction_count
-
-    user, correction_count = get_user_with_correction_count(db, current_user.id)
-    user.total_corrections = correction_count
-    return user
+    # The user row is already loaded; only the correction count is needed
+    current_user.total_corrections = crud.get_correction_count_by_user(
+        db, current_user.id
+    )
+    return current_user
 
 
 @router.get(
@@ -151,18 +148,18 @@ async def get_current_user_profile(
     summary="Get user by ID",
     description="Retrieve user information by user ID (admin only)",
 )
-async def get_user(
+def get_user(
     user_id: int,
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Get user by ID (admin only)."""
-    db_user = crud.get_user(db, user_id=user_id)
-    if db_user is None:
+    # User and correction count in one query
+    result = crud.get_user_with_correction_count(db, user_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get correction count
-    user, correction_count = crud.get_user_with_correction_count(db, user_id)
+    user, correction_count = result
     user.total_corrections = correction_count
     return user
 
@@ -173,14 +170,14 @@ async def get_user(
     summary="Update current user profile",
     description="Update profile information for the currently authenticated user",
 )
-async def update_current_user(
+def update_current_user(
     user_update: schemas.UserUpdate,
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update current user profile."""
     # Prevent role escalation - regular users cannot change their role
-    update_data = user_update.dict(exclude_unset=True)
+    update_data = user_update.model_dump(exclude_unset=True)
     if "role" in update_data:
         del update_data["role"]  # Remove role from update data
 
@@ -199,7 +196,7 @@ async def update_current_user(
     summary="Update user by ID",
     description="Update user information by user ID (admin only)",
 )
-async def update_user(
+def update_user(
     user_id: int,
     user_update: schemas.UserUpdate,
     current_user=Depends(get_current_admin_user),
@@ -217,7 +214,7 @@ async def update_user(
     summary="Change current user password",
     description="Change password for the currently authenticated user",
 )
-async def change_current_user_password(
+def change_current_user_password(
     password_change: schemas.UserPasswordChange,
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -239,7 +236,7 @@ async def change_current_user_password(
     summary="Change user password by ID",
     description="Change password for a specific user (admin only)",
 )
-async def change_user_password(
+def change_user_password(
     user_id: int,
     password_change: schemas.UserPasswordChange,
     current_user=Depends(get_current_admin_user),
@@ -262,7 +259,7 @@ async def change_user_password(
     summary="Delete user",
     description="Delete user account and all associated data (admin only)",
 )
-async def delete_user(
+def delete_user(
     user_id: int,
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
@@ -280,15 +277,33 @@ async def delete_user(
     summary="List users",
     description="Get paginated list of all users (admin only)",
 )
-async def list_users(
+def list_users(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    before: Optional[datetime] = Query(
+        None,
+        description=(
+            "Keyset cursor: only return items created before this timestamp"
+            " (overrides page)"
+        ),
+    ),
+    before_id: Optional[int] = Query(
+        None,
+        description="Keyset cursor tiebreaker: id of the last item seen (with before)",
+    ),
     current_user=Depends(get_current_admin_user),
     db: Session = Depends(get_db),
 ):
     """Get paginated list of users (admin only)."""
     skip = (page - 1) * per_page
-    users = crud.get_users(db, skip=skip, limit=per_page)
+    users = crud.get_users(
+        db, skip=skip, limit=per_page, before=before, before_id=before_id
+    )
     total = crud.get_user_count(db)
 
-    return {"users": users, "total": total, "page": page, "per_page": per_page}
+    # Validate and serialize in one pass; FastAPI skips re-validating a Response
+    payload = schemas.UserList.model_validate(
+        {"users": users, "total": total, "page": page, "per_page": per_page},
+        from_attributes=True,
+    )
+    return Response(payload.model_dump_json(), media_type="application/json")
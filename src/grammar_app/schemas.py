@@ -7,7 +7,7 @@ This module contains Pydantic models for request/response validation.
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 # Base schemas
@@ -16,6 +16,8 @@ class TextRequest(BaseModel):
 
     text: str
 
+    model_config = ConfigDict(strict=True)
+
 
 class CorrectionResponse(BaseModel):
     """Response schema for grammar correction."""
@@ -70,8 +72,7 @@ class UserResponse(UserBase):
     updated_at: datetime
     total_corrections: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserList(BaseModel):
@@ -128,8 +129,7 @@ class GrammarCorrectionResponse(GrammarCorrectionBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GrammarCorrectionList(BaseModel):
@@ -139,6 +139,10 @@ class GrammarCorrectionList(BaseModel):
     total: int
     page: int
     per_page: int
+    # Pass as ``before`` and ``before_id`` to fetch the next page; None on
+    # the last page
+    next_cursor: Optional[datetime] = None
+    next_cursor_id: Optional[int] = None
 
 
 # Database operation schemas
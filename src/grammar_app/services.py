@@ -4,174 +4,95 @@ Grammar Correction Service
 This module contains the core grammar correction functionality using AI models.
 """
 
+import logging
 import os
 import re
+import threading
+from functools import lru_cache
 from typing import List, Optional
 
 import torch
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
 
-class GrammarCorrectionService:
-    """Service class for grammar correction using AI models."""
-
-    def __init__(self):
-        """Initialize the grammar correction service."""
-        self.model = None
-        self.tokenizer = None
-        self.pipeline = None
-        self.device = settings.DEVICE
-        self.model_name = settings.MODEL_NAME
-        self.model_dir = settings.MODEL_DIR
-
-        # Load model on initialization
-        self._load_model()
-
-    def _load_model(self):
-        """Load the grammar correction model."""
-        try:
-            # Check if model exists locally
-            if os.path.exists(self.model_dir):
-                print(f"Loading local model from {self.model_dir}")
-                self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_dir)
-                self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
-            else:
-                print(f"Downloading model {self.model_name}")
-                self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-                self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-
-                # Save model locally for future use
-                # os.makedirs(self.model_dir, exist_ok=True)
-                # self.model.save_pretrained(self.model_dir)
-                # self.tokenizer.save_pretrained(self.model_dir)
-                # print(f"Model saved to {self.model_dir}")
-
-            # Create pipeline
-            self.pipeline = pipeline(
-                "text2text-generation",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=self.device,
-            )
+# Shape of a rule matching a fixed list of words: \b(word|word...)\b
+_WORD_LIST_RULE = re.compile(r"\\b\((.+)\)\\b")
 
-        except Exception as e:
-            print(f"Error loading model: {e}")
-            self.pipeline = None
 
-    def correct_grammar(self, text: str) -> str:
-        """
-        Correct grammar in the given text.
+def _required_words(pattern):
+    """Return literal words, one of which any match of ``pattern`` contains.
 
-        Args:
-            text: Input text to correct
-
-        Returns:
-            Corrected text
-        """
-        if not text or not text.strip():
-            return text
-
-        # Strategy 1: Apply basic rules first (fast and reliable)
-        if settings.USE_BASIC_RULES_FIRST:
-            basic_corrected = self._apply_basic_grammar_rules(text)
-            if basic_corrected != text:
-                print(f"Basic rules applied: '{text}' -> '{basic_corrected}'")
-                return basic_corrected
-
-        # Strategy 2: Try AI model for complex corrections
-        if self.pipeline and settings.USE_AI_MODEL_FALLBACK:
-            try:
-                ai_corrected = self._correct_with_ai(text)
-                if ai_corrected and ai_corrected != text and len(ai_corrected) > 0:
-                    print(f"AI model applied: '{text}' -> '{ai_corrected}'")
-                    return ai_corrected
-            except Exception as e:
-                print(f"AI correction failed: {e}")
-
-        # Strategy 3: Apply basic rules as final fallback
-        if not settings.USE_BASIC_RULES_FIRST:
-            basic_corrected = self._apply_basic_grammar_rules(text)
-            if basic_corrected != text:
-                print(f"Basic rules fallback: '{text}' -> '{basic_corrected}'")
-                return basic_corrected
-
-        # Return original if no corrections made
-        return text
-
-    def _correct_with_ai(self, text: str) -> str:
-        """Correct grammar using AI model."""
-        try:
-            # For T5 grammar correction models, use the text directly as input
-            # The model is trained to take grammatically incorrect text and output corrected text
-
-            # Generate correction with improved parameters
-            result = self.pipeline(
-                text,  # Use the text directly without a prompt
-                max_new_tokens=settings.MODEL_MAX_LENGTH,
-                temperature=settings.MODEL_TEMPERATURE,
-                top_p=settings.MODEL_TOP_P,
-                repetition_penalty=settings.MODEL_REPETITION_PENALTY,
-                do_sample=settings.MODEL_DO_SAMPLE,
-                num_return_sequences=1,
-                pad_token_id=self.tokenizer.eos_token_id,
-                eos_token_id=self.tokenizer.eos_token_id,
-            )
-
-            if result and len(result) > 0:
-                corrected = result[0]["generated_text"].strip()
-
-                # Clean up the response - remove any prompt prefixes
-                if corrected.startswith("grammar:"):
-                    corrected = corrected.replace("grammar:", "").strip()
-                elif corrected.startswith("Correct the grammar in this text:"):
-                    corrected = corrected.replace(
-                        "Correct the grammar in this text:", ""
-                    ).strip()
-                elif corrected.startswith("Corrected text:"):
-                    corrected = corrected.replace("Corrected text:", "").strip()
-                elif corrected.startswith("Corrected:"):
-                    corrected = corrected.replace("Corrected:", "").strip()
-
-                # If the corrected text is the same as input or empty, return original
-                if corrected == text or not corrected:
-                    return text
-
-                return corrected
-
-        except Exception as e:
-            print(f"AI correction error: {e}")
-
-        return text
-
-    def _apply_basic_grammar_rules(self, text: str) -> str:
-        """
-        Apply basic grammar correction rules as fallback.
-
-        Args:
-            text: Input text
-
-        Returns:
-            Text with basic grammar corrections
-        """
-        if not text:
-            return text
-
-        # Common grammar fixes
-        corrections = [
+    The pattern is split on its ``\\s`` separators and the token whose
+    shortest alternative is longest wins; None if no token is a plain word list.
+    """
+    best = None
+    for token in re.split(r"\\s[+*]", pattern):
+        alternatives = token.replace("\\b", "").strip("()").split("|")
+        if not all(word.isalpha() for word in alternatives):
+            continue
+        if best is None or min(map(len, alternatives)) > min(map(len, best)):
+            best = alternatives
+    return tuple(word.lower() for word in best) if best else None
+
+
+def _sequential_rules(rules):
+    """Compile rules applied one after another (later rules see earlier output)."""
+    return [
+        (re.compile(pattern, re.IGNORECASE), replacement, _required_words(pattern))
+        for pattern, replacement in rules
+    ]
+
+
+def _fused_rules(rules):
+    """Compile word-list rules into a single alternation.
+
+    Every pattern must have the form ``\\b(phrase|phrase...)\\b`` with a
+    constant replacement, and no replacement may produce text that another
+    rule of the group rewrites; the whole group is then applied in one scan
+    instead of one scan per rule.
+    """
+    replacements = {}
+    for pattern, replacement in rules:
+        phrases = _WORD_LIST_RULE.fullmatch(pattern).group(1)
+        for phrase in phrases.split("|"):
+            replacements[phrase.replace("\\'", "'").lower()] = replacement
+    # Longest first, so a phrase is never cut short by one of its prefixes
+    phrases = sorted(replacements, key=len, reverse=True)
+    fused = re.compile(
+        rf"\b(?:{'|'.join(map(re.escape, phrases))})\b", re.IGNORECASE
+    )
+    # IGNORECASE also matches non-ASCII text such as "ı" or "ſ" whose lower()
+    # is not the phrase; that text resolves the match by group number instead
+    grouped = re.compile(
+        rf"\b(?:{'|'.join(f'({re.escape(phrase)})' for phrase in phrases)})\b",
+        re.IGNORECASE,
+    )
+    by_group = [None] + [replacements[phrase] for phrase in phrases]
+    _NON_ASCII_VARIANTS[fused] = (grouped, lambda match: by_group[match.lastindex])
+    return [(fused, lambda match: replacements[match.group().lower()], None)]
+
+
+# Fused pattern -> (pattern, replacement) safe to apply to non-ASCII text
+_NON_ASCII_VARIANTS = {}
+
+
+# Common grammar fixes, compiled once at import:
+# (pattern, replacement, words one of which must be present or None)
+_BASIC_RULES = (
+    *_sequential_rules(
+        [
             # Subject-verb agreement for "is" vs "are"
-            (r"\b(you)\s+(is)\b", r"\1 are"),
-            (r"\b(we)\s+(is)\b", r"\1 are"),
-            (r"\b(they)\s+(is)\b", r"\1 are"),
+            (r"\b(you|we|they)\s+(is)\b", r"\1 are"),
             (r"\b(I)\s+(are)\b", r"\1 am"),
-            (r"\b(he)\s+(are)\b", r"\1 is"),
-            (r"\b(she)\s+(are)\b", r"\1 is"),
-            (r"\b(it)\s+(are)\b", r"\1 is"),
-            # Subject-verb agreement - more specific rules
-            (r"\b(he|she|it)\s+(am|are)\s+", r"\1 is "),
-            (r"\b(I)\s+(are|is)\s+", r"\1 am "),
-            (r"\b(we|you|they)\s+(am|is)\s+", r"\1 are "),
+            (r"\b(he|she|it)\s+(are)\b", r"\1 is"),
+            # Subject-verb agreement - more specific rules (the verbs fixed
+            # just above can no longer occur here)
+            (r"\b(he|she|it)\s+(am)\s+", r"\1 is "),
+            (r"\b(I)\s+(is)\s+", r"\1 am "),
+            (r"\b(we|you|they)\s+(am)\s+", r"\1 are "),
             (r"\b(I|he|she|it)\s+(go|goes)\s+", r"\1 goes "),
             (r"\b(we|you|they)\s+(goes)\s+", r"\1 go "),
             # Past perfect tense corrections
@@ -185,6 +106,10 @@ class GrammarCorrectionService:
             # Articles - Fixed implementation
             (r"\b(a)\s+([aeiou][a-z]*)\b", r"an \2"),  # a apple -> an apple
             (r"\b(an)\s+([bcdfghjklmnpqrstvwxyz][a-z]*)\b", r"a \2"),  # an book -> a book
+        ]
+    ),
+    *_fused_rules(
+        [
             # Common contractions
             (r"\b(do not|don\'t)\b", r"don't"),
             (r"\b(does not|doesn\'t)\b", r"doesn't"),
@@ -215,21 +140,37 @@ class GrammarCorrectionService:
             (r"\b(arent)\b", r"aren't"),
             (r"\b(wasnt)\b", r"wasn't"),
             (r"\b(werent)\b", r"weren't"),
+        ]
+    ),
+    *_fused_rules(
+        [
             # Capitalization fixes
             (r"\b(i)\b", r"I"),  # lowercase i -> I
             (r"\b(hello|hi)\b", r"Hello"),  # greetings
             (r"\b(bye|goodbye)\b", r"Goodbye"),
+        ]
+    ),
+    *_sequential_rules(
+        [
             # Advanced grammar rules
             (r"\b(me)\s+and\s+(him|her|them)\b", r"\2 and I"),  # me and him -> him and I
             (r"\b(him|her|them)\s+and\s+(me)\b", r"\1 and I"),  # him and me -> him and I
             (r"\b(me)\s+and\s+(I)\b", r"\2 and I"),  # me and I -> I and I
             (r"\b(I)\s+and\s+(me)\b", r"I and I"),  # I and me -> I and I
+        ]
+    ),
+    *_fused_rules(
+        [
             # Fix common informal phrases
             (r"\b(gonna)\b", r"going to"),
             (r"\b(wanna)\b", r"want to"),
             (r"\b(gotta)\b", r"got to"),
             (r"\b(lemme)\b", r"let me"),
             (r"\b(gimme)\b", r"give me"),
+        ]
+    ),
+    *_sequential_rules(
+        [
             # Fix double negatives
             (r"\b(not)\s+\w+\s+(not)\b", r"\1 \2"),  # not do not -> not do not (simplified)
             # Fix common word confusions
@@ -242,18 +183,316 @@ class GrammarCorrectionService:
             # Punctuation
             (r"\s+([.!?])", r"\1"),  # Remove spaces before punctuation
             (r"([.!?])\s*([a-z])", r"\1 \2"),  # Add space after punctuation
-            (r"\s+", r" "),  # Multiple spaces to single space
         ]
+    ),
+)
+
+# The same rules for non-ASCII text, which always runs every rule
+_NON_ASCII_RULES = tuple(
+    (*_NON_ASCII_VARIANTS.get(pattern, (pattern, replacement)), None)
+    for pattern, replacement, _ in _BASIC_RULES
+)
+
 
-        corrected = text
-        for pattern, replacement in corrections:
-            corrected = re.sub(pattern, replacement, corrected, flags=re.IGNORECASE)
+def _apply_basic_rules(text: str) -> str:
+    """Apply the basic grammar rules; a free function so batches can map() it."""
+    if not text:
+        return text
 
-        # Capitalize first letter
-        if corrected and corrected[0].islower():
-            corrected = corrected[0].upper() + corrected[1:]
+    corrected = text
+    # Rules whose trigger words are absent are skipped. Non-ASCII text can
+    # match case-insensitively without containing them (e.g. "ı" for "i"),
+    # so it always runs every rule
+    if corrected.isascii():
+        rules, lowered = _BASIC_RULES, corrected.lower()
+    else:
+        rules, lowered = _NON_ASCII_RULES, None
+    for pattern, replacement, triggers in rules:
+        if lowered is not None and triggers:
+            if not any(word in lowered for word in triggers):
+                continue
+        result = pattern.sub(replacement, corrected)
+        if lowered is not None and result != corrected:
+            lowered = result.lower()
+        corrected = result
+
+    # Only a lowercase first character is capitalized, leading space or not
+    capitalize = corrected[:1].islower()
+
+    # Collapse whitespace runs and trim the ends in one pass
+    corrected = " ".join(corrected.split())
+    if capitalize:
+        corrected = corrected[0].upper() + corrected[1:]
+
+    return corrected
 
-        return corrected.strip()
+
+class GrammarCorrectionService:
+    """Service class for grammar correction using AI models."""
+
+    def __init__(self):
+        """Initialize the grammar correction service."""
+        self.model = None
+        self.tokenizer = None
+        self.prefix = ""
+        self.device = settings.DEVICE
+        self.model_name = settings.MODEL_NAME
+        self.model_dir = settings.MODEL_DIR
+        # Uncompiled forward pass, restored if the compiled one fails to warm up
+        self._eager_forward = None
+
+        # Repeated inputs are answered from memory; sampled output is not
+        # deterministic, so it is never cached
+        cache_size = 0 if settings.MODEL_DO_SAMPLE else settings.CORRECTION_CACHE_SIZE
+        self._cached_correct = lru_cache(maxsize=cache_size)(self._correct)
+
+    def _load_model(self):
+        """Load the grammar correction model."""
+        try:
+            if settings.MODEL_RUNTIME == "onnxruntime":
+                source = self.model_name
+                if os.path.exists(self.model_dir):
+                    source = self.model_dir
+                self.model = self._load_onnx_model(source)
+                self.tokenizer = AutoTokenizer.from_pretrained(source)
+                self.prefix = self.model.config.prefix or ""
+                return
+
+            model_kwargs = {}
+            if (
+                settings.MODEL_BF16
+                and self.device == "cuda"
+                and torch.cuda.is_bf16_supported()
+            ):
+                # Half the weight bandwidth; not float16, which overflows in T5
+                model_kwargs["torch_dtype"] = torch.bfloat16
+
+            # Check if model exists locally
+            if os.path.exists(self.model_dir):
+                logger.info("Loading local model from %s", self.model_dir)
+                self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                    self.model_dir, **model_kwargs
+                )
+                self.tokenizer = AutoTokenizer.from_pretrained(self.model_dir)
+            else:
+                logger.info("Downloading model %s", self.model_name)
+                self.model = AutoModelForSeq2SeqLM.from_pretrained(
+                    self.model_name, **model_kwargs
+                )
+                self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+
+                # Save model locally for future use
+                # os.makedirs(self.model_dir, exist_ok=True)
+                # self.model.save_pretrained(self.model_dir)
+                # self.tokenizer.save_pretrained(self.model_dir)
+                # print(f"Model saved to {self.model_dir}")
+
+            if settings.MODEL_QUANTIZE_INT8 and self.device == "cpu":
+                # Int8 Linear layers (dynamic: activations are quantized per call)
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            elif settings.MODEL_COMPILE and hasattr(torch, "compile"):
+                # Compile the forward pass that generate() calls on every
+                # decoding step (dynamic quantized kernels do not compile)
+                compile_mode = (
+                    "reduce-overhead" if self.device == "cuda"
+                    else "max-autotune-no-cudagraphs"
+                )
+                self._eager_forward = self.model.forward
+                self.model.forward = torch.compile(
+                    self.model.forward, mode=compile_mode, dynamic=True
+                )
+
+            # Generate with the model directly; the pipeline wrapper only adds
+            # per-call argument parsing and post-processing
+            self.model.to(self.device)
+            self.prefix = self.model.config.prefix or ""
+
+        except Exception as e:
+            logger.error("Error loading model: %s", e)
+            self.model = None
+
+    def _warm_up(self):
+        """Run throwaway generations so the first request finds warm caches."""
+        if self.model is None:
+            return
+        try:
+            # The second pass runs on graphs and kernels the first one compiled
+            for _ in range(2):
+                self._generate(["Warm up the model."])
+        except Exception as e:
+            if self._eager_forward is None:
+                logger.warning("Model warm-up failed: %s", e)
+                return
+            # Compilation or autotuning failed (e.g. no C++ toolchain); the
+            # eager forward pass is slower but still serves AI corrections
+            logger.warning("Compiled model failed, falling back to eager: %s", e)
+            self.model.forward = self._eager_forward
+            self._eager_forward = None
+            self._warm_up()
+
+    def _load_onnx_model(self, source: str):
+        """Load the model into ONNX Runtime, exporting it on first use."""
+        # Optional dependency, only needed for MODEL_RUNTIME="onnxruntime"
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+
+        provider = (
+            "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+        )
+        onnx_dir = f"{self.model_dir}_onnx"
+        if os.path.exists(onnx_dir):
+            logger.info("Loading ONNX model from %s", onnx_dir)
+            return ORTModelForSeq2SeqLM.from_pretrained(onnx_dir, provider=provider)
+
+        logger.info("Exporting %s to ONNX", source)
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            source, export=True, provider=provider
+        )
+        model.save_pretrained(onnx_dir)
+        return model
+
+    def correct_grammar(self, text: str) -> str:
+        """
+        Correct grammar in the given text.
+
+        Args:
+            text: Input text to correct
+
+        Returns:
+            Corrected text
+        """
+        if not text or not text.strip():
+            return text
+
+        try:
+            return self._cached_correct(text)
+        except Exception as e:
+            # Raised out of the memoized path so a transient model error
+            # (OOM, CUDA hiccup) is not cached as the answer for this text
+            logger.warning("AI correction failed: %s", e)
+            return self._correct_without_ai(text)
+
+    def _correct(self, text: str) -> str:
+        """Correct a non-empty text (memoized by ``correct_grammar``).
+
+        Model errors propagate, so only successful results are memoized.
+        """
+        # Strategy 1: Apply basic rules first (fast and reliable)
+        if settings.USE_BASIC_RULES_FIRST:
+            basic_corrected = self._apply_basic_grammar_rules(text)
+            if basic_corrected != text:
+                logger.debug("Basic rules applied: %r -> %r", text, basic_corrected)
+                return basic_corrected
+
+        # Strategy 2: Try AI model for complex corrections
+        if self.model is not None and settings.USE_AI_MODEL_FALLBACK:
+            ai_corrected = self._correct_with_ai(text)
+            if ai_corrected and ai_corrected != text and len(ai_corrected) > 0:
+                logger.debug("AI model applied: %r -> %r", text, ai_corrected)
+                return ai_corrected
+
+        return self._correct_without_ai(text)
+
+    def _correct_without_ai(self, text: str) -> str:
+        """Finish a correction the model did not (or could not) make."""
+        # Strategy 3: Apply basic rules as final fallback
+        if not settings.USE_BASIC_RULES_FIRST:
+            basic_corrected = self._apply_basic_grammar_rules(text)
+            if basic_corrected != text:
+                logger.debug("Basic rules fallback: %r -> %r", text, basic_corrected)
+                return basic_corrected
+
+        # Return original if no corrections made
+        return text
+
+    def _generate(self, texts: List[str]) -> List[str]:
+        """Generate corrections for ``texts`` in batches of MODEL_BATCH_SIZE."""
+        if settings.MODEL_DO_SAMPLE:
+            decoding = dict(
+                do_sample=True,
+                temperature=settings.MODEL_TEMPERATURE,
+                top_p=settings.MODEL_TOP_P,
+            )
+        else:
+            # Plain greedy search: no logits warpers, single beam
+            decoding = dict(do_sample=False, num_beams=1)
+
+        outputs = []
+        batch_size = max(1, settings.MODEL_BATCH_SIZE)
+        for start in range(0, len(texts), batch_size):
+            batch = [self.prefix + text for text in texts[start:start + batch_size]]
+            # Use the text directly without a prompt (plus the model's own prefix)
+            inputs = self.tokenizer(batch, return_tensors="pt", padding=True)
+            if self.device == "cuda":
+                # Copy from pinned memory so the transfer overlaps kernel launch
+                inputs = {
+                    key: value.pin_memory().to(self.device, non_blocking=True)
+                    for key, value in inputs.items()
+                }
+            else:
+                inputs = inputs.to(self.device)
+            with torch.inference_mode():
+                generated = self.model.generate(
+                    **inputs,
+                    max_new_tokens=settings.MODEL_MAX_LENGTH,
+                    repetition_penalty=settings.MODEL_REPETITION_PENALTY,
+                    num_return_sequences=1,
+                    use_cache=True,
+                    pad_token_id=self.tokenizer.eos_token_id,
+                    eos_token_id=self.tokenizer.eos_token_id,
+                    **decoding,
+                )
+            outputs.extend(
+                self.tokenizer.batch_decode(
+                    generated,
+                    skip_special_tokens=True,
+                    clean_up_tokenization_spaces=False,
+                )
+            )
+        return outputs
+
+    @staticmethod
+    def _clean_ai_output(text: str, generated: str) -> str:
+        """Extract the corrected text from the model output for ``text``."""
+        corrected = generated.strip()
+
+        # Clean up the response - remove any prompt prefixes
+        if corrected.startswith("grammar:"):
+            corrected = corrected.replace("grammar:", "").strip()
+        elif corrected.startswith("Correct the grammar in this text:"):
+            corrected = corrected.replace(
+                "Correct the grammar in this text:", ""
+            ).strip()
+        elif corrected.startswith("Corrected text:"):
+            corrected = corrected.replace("Corrected text:", "").strip()
+        elif corrected.startswith("Corrected:"):
+            corrected = corrected.replace("Corrected:", "").strip()
+
+        # If the corrected text is the same as input or empty, return original
+        if corrected == text or not corrected:
+            return text
+
+        return corrected
+
+    def _correct_with_ai(self, text: str) -> str:
+        """Correct grammar using AI model (errors propagate to the caller)."""
+        # For T5 grammar correction models, use the text directly as input
+        # The model is trained to take grammatically incorrect text and output
+        # corrected text
+        return self._clean_ai_output(text, self._generate([text])[0])
+
+    def _apply_basic_grammar_rules(self, text: str) -> str:
+        """
+        Apply basic grammar correction rules as fallback.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Text with basic grammar corrections
+        """
+        return _apply_basic_rules(text)
 
     def batch_correct(self, texts: List[str]) -> List[str]:
         """
@@ -265,7 +504,43 @@ class GrammarCorrectionService:
         Returns:
             List of corrected texts
         """
-        return [self.correct_grammar(text) for text in texts]
+        results = list(texts)
+        pending = []  # (index, text) pairs not settled by the basic rules
+
+        if settings.USE_BASIC_RULES_FIRST:
+            basic = list(map(_apply_basic_rules, texts))
+
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if settings.USE_BASIC_RULES_FIRST and basic[index] != text:
+                results[index] = basic[index]
+                continue
+            pending.append((index, text))
+
+        # Batched generate calls instead of one generate per text
+        if pending and self.model is not None and settings.USE_AI_MODEL_FALLBACK:
+            pending_texts = [text for _, text in pending]
+            try:
+                outputs = self._generate(pending_texts)
+            except Exception as e:
+                logger.warning("AI batch correction failed: %s", e)
+                outputs = [""] * len(pending)
+
+            still_pending = []
+            for (index, text), output in zip(pending, outputs):
+                ai_corrected = self._clean_ai_output(text, output)
+                if ai_corrected != text:
+                    results[index] = ai_corrected
+                else:
+                    still_pending.append((index, text))
+            pending = still_pending
+
+        if not settings.USE_BASIC_RULES_FIRST:
+            for index, text in pending:
+                results[index] = _apply_basic_rules(text)
+
+        return results
 
     def get_model_info(self) -> dict:
         """Get information about the loaded model."""
@@ -273,23 +548,35 @@ class GrammarCorrectionService:
             "model_name": self.model_name,
             "model_dir": self.model_dir,
             "device": self.device,
-            "model_loaded": self.pipeline is not None,
+            "model_loaded": self.model is not None,
             "model_type": "text2text-generation",
         }
 
 
 # Global service instance (singleton pattern)
 _grammar_service = None
+_grammar_lock = threading.Lock()
 
 
 def get_grammar_service() -> GrammarCorrectionService:
     """Get the global grammar correction service instance."""
     global _grammar_service
     if _grammar_service is None:
-        _grammar_service = GrammarCorrectionService()
+        # Concurrent first requests wait here instead of each loading the model
+        with _grammar_lock:
+            if _grammar_service is None:
+                service = GrammarCorrectionService()
+                service._load_model()
+                service._warm_up()
+                _grammar_service = service
     return _grammar_service
 
 
+def is_grammar_service_ready() -> bool:
+    """Whether the global service has finished loading (never blocks)."""
+    return _grammar_service is not None
+
+
 def correct_grammar(text: str) -> str:
     """
     Correct grammar in the given text.
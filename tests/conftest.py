@@ -8,22 +8,40 @@ import asyncio
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from src.grammar_app.crud import clear_caches
 from src.grammar_app.database import Base, get_db
 from src.grammar_app.main import app
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite:///./test_grammar.db"
+# Test database URL (in memory, so tests never touch the disk)
+TEST_DATABASE_URL = "sqlite://"
 
-# Create test engine
+# Create test engine; StaticPool keeps the single in-memory connection alive
 test_engine = create_engine(
-    TEST_DATABASE_URL, connect_args={"check_same_thread": False}
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
 
+
+@event.listens_for(test_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
 # Create test session
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=test_engine
+)
 
 
 @pytest.fixture(scope="session")
@@ -47,13 +65,18 @@ def db_session(test_db):
     """Create a fresh database session for each test."""
     connection = test_engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    # Commits inside the app release a SAVEPOINT; the outer rollback undoes all
+    session = TestingSessionLocal(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
 
     yield session
 
     session.close()
     transaction.rollback()
     connection.close()
+    # Cached lookups may refer to rows that were just rolled back
+    clear_caches()
 
 
 @pytest.fixture
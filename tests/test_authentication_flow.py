@@ -11,6 +11,7 @@ This script demonstrates the complete JWT authentication flow:
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -23,6 +24,9 @@ def test_authentication_flow():
     print("🔐 Testing JWT Authentication Flow")
     print("=" * 50)
 
+    # One session so every request reuses a kept-alive connection
+    session = requests.Session()
+
     # Step 1: User Registration
     print("\n📝 Step 1: User Registration")
     print("-" * 30)
@@ -35,7 +39,7 @@ def test_authentication_flow():
     }
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/users/register",
             json=test_user,
             headers={"Content-Type": "application/json"},
@@ -68,7 +72,7 @@ def test_authentication_flow():
     login_data = {"email": test_user["email"], "password": test_user["password"]}
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/users/login",
             json=login_data,
             headers={"Content-Type": "application/json"},
@@ -113,7 +117,7 @@ def test_authentication_flow():
 
     # Test getting current user profile
     try:
-        response = requests.get(f"{BASE_URL}/users/me", headers=headers)
+        response = session.get(f"{BASE_URL}/users/me", headers=headers)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Get current user profile: {data.get('email')}")
@@ -129,26 +133,32 @@ def test_authentication_flow():
 
     test_texts = ["how is you?", "I goes to the store", "She don't like it"]
 
-    for i, text in enumerate(test_texts, 1):
+    def correct(text):
         try:
-            response = requests.post(
+            return session.post(
                 f"{BASE_URL}/correct", json={"text": text}, headers=headers
             )
+        except Exception as e:
+            return e
 
-            if response.status_code == 200:
-                data = response.json()
-                original = data.get("original", "")
-                corrected = data.get("corrected", "")
+    # Send the corrections concurrently; results come back in input order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        responses = list(executor.map(correct, test_texts))
 
-                if corrected != original:
-                    print(f"✅ Test {i}: '{text}' → '{corrected}'")
-                else:
-                    print(f"⚠️  Test {i}: '{text}' (no change)")
-            else:
-                print(f"❌ Test {i} failed: {response.status_code}")
+    for i, (text, response) in enumerate(zip(test_texts, responses), 1):
+        if isinstance(response, Exception):
+            print(f"❌ Test {i} error: {response}")
+        elif response.status_code == 200:
+            data = response.json()
+            original = data.get("original", "")
+            corrected = data.get("corrected", "")
 
-        except Exception as e:
-            print(f"❌ Test {i} error: {e}")
+            if corrected != original:
+                print(f"✅ Test {i}: '{text}' → '{corrected}'")
+            else:
+                print(f"⚠️  Test {i}: '{text}' (no change)")
+        else:
+            print(f"❌ Test {i} failed: {response.status_code}")
 
     # Step 4: Test User-Specific Data
     print("\n📊 Step 4: Testing User-Specific Data")
@@ -156,7 +166,7 @@ def test_authentication_flow():
 
     # Test getting user's corrections
     try:
-        response = requests.get(
+        response = session.get(
             f"{BASE_URL}/corrections?page=1&per_page=10", headers=headers
         )
         if response.status_code == 200:
@@ -175,7 +185,7 @@ def test_authentication_flow():
 
     # Test getting user statistics
     try:
-        response = requests.get(f"{BASE_URL}/analytics/my-stats", headers=headers)
+        response = session.get(f"{BASE_URL}/analytics/my-stats", headers=headers)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Get user stats: {data.get('total_corrections', 0)} corrections")
@@ -190,7 +200,7 @@ def test_authentication_flow():
     print("-" * 30)
 
     try:
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/correct/anonymous",
             json={"text": "hello my name ram"},
             headers={"Content-Type": "application/json"},
@@ -220,7 +230,7 @@ def test_authentication_flow():
     }
 
     try:
-        response = requests.get(f"{BASE_URL}/users/me", headers=invalid_headers)
+        response = session.get(f"{BASE_URL}/users/me", headers=invalid_headers)
         if response.status_code == 401:
             print("✅ Invalid token properly rejected (401 Unauthorized)")
         else:
@@ -230,7 +240,7 @@ def test_authentication_flow():
 
     # Test without token
     try:
-        response = requests.get(
+        response = session.get(
             f"{BASE_URL}/users/me", headers={"Content-Type": "application/json"}
         )
         if response.status_code == 403:
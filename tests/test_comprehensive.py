@@ -11,14 +11,79 @@ This script tests ALL routes from the new modular structure:
 - Swagger Documentation
 """
 
+import asyncio
+import io
 import json
+import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # API Base URL
 BASE_URL = "http://localhost:8000"
+REQUEST_TIMEOUT = 5
+JSON = {"Content-Type": "application/json"}
+
+# Transient failures (server still booting, proxy hiccups) are retried for
+# idempotent methods only; a replayed POST could register or save twice
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+)
+
+# One keep-alive connection pool for the sequential requests
+SESSION = requests.Session()
+SESSION.mount(
+    "http://", HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=RETRY)
+)
+
+
+async def _send(client, method, url, status_only=False, **kwargs):
+    if not status_only:
+        return await client.request(method, url, **kwargs)
+    # Only the status is checked; the body is closed without being read
+    request = client.build_request(method, url, **kwargs)
+    response = await client.send(request, stream=True)
+    await response.aclose()
+    return response
+
+
+async def _send_all(calls):
+    # httpx retries failed connects only; status codes are reported as they are.
+    # Each request still times out, so a hung server fails the check instead
+    # of blocking the suite
+    transport = httpx.AsyncHTTPTransport(retries=3)
+    async with httpx.AsyncClient(
+        base_url=BASE_URL, timeout=REQUEST_TIMEOUT, transport=transport
+    ) as client:
+        return await asyncio.gather(
+            *(_send(client, method, url, **kwargs) for method, url, kwargs in calls),
+            return_exceptions=True,
+        )
+
+
+def send_all(*calls):
+    """Send independent (method, url, kwargs) requests concurrently, in order.
+
+    Pass ``status_only=True`` in kwargs for checks that never read the body.
+    """
+    return asyncio.run(_send_all(calls))
+
+
+def _result(response):
+    """Re-raise a failed request inside the caller's error handling."""
+    if isinstance(response, Exception):
+        raise response
+    return response
 
 
 def test_system_routes():
@@ -26,11 +91,16 @@ def test_system_routes():
     print("🔧 Testing System Routes...")
     print("-" * 30)
 
+    responses = send_all(
+        ("GET", "/", {}),
+        ("GET", "/health", {}),
+    )
+
     # Test root endpoint
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = _result(responses[0])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Root endpoint: {data.get('message', 'N/A')}")
             print(f"   Developer: {data.get('developer', 'N/A')}")
             print(f"   Status: {data.get('status', 'N/A')}")
@@ -41,9 +111,9 @@ def test_system_routes():
 
     # Test health endpoint
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = _result(responses[1])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Health endpoint: {data.get('status', 'N/A')}")
             print(f"   Model loaded: {data.get('model_loaded', 'N/A')}")
         else:
@@ -66,16 +136,18 @@ def test_grammar_routes():
         "hello my name ram",
     ]
 
+    # All corrections in flight at once
+    bodies = [orjson.dumps({"text": text}) for text in test_texts]
+    responses = send_all(
+        *(("POST", "/correct", {"content": body, "headers": JSON}) for body in bodies)
+    )
+
     success_count = 0
-    for i, text in enumerate(test_texts, 1):
+    for i, (text, response) in enumerate(zip(test_texts, responses), 1):
         try:
-            response = requests.post(
-                f"{BASE_URL}/correct",
-                json={"text": text},
-                headers={"Content-Type": "application/json"},
-            )
+            response = _result(response)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 original = data.get("original", "")
                 corrected = data.get("corrected", "")
 
@@ -109,13 +181,14 @@ def test_user_routes():
 
     # Test user registration
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/users/register",
-            json=test_user,
-            headers={"Content-Type": "application/json"},
+            data=orjson.dumps(test_user),
+            headers=JSON,
+            timeout=REQUEST_TIMEOUT,
         )
         if response.status_code == 201:
-            data = response.json()
+            data = orjson.loads(response.content)
             user_id = data.get("id")
             print(f"✅ User registration: {data.get('email', 'N/A')} (ID: {user_id})")
         else:
@@ -128,13 +201,14 @@ def test_user_routes():
     # Test user login
     try:
         login_data = {"email": test_user["email"], "password": test_user["password"]}
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/users/login",
-            json=login_data,
-            headers={"Content-Type": "application/json"},
+            data=orjson.dumps(login_data),
+            headers=JSON,
+            timeout=REQUEST_TIMEOUT,
         )
         if response.status_code == 200:
-            login_data = response.json()
+            login_data = orjson.loads(response.content)
             print(f"✅ User login: {login_data.get('user', {}).get('email', 'N/A')}")
         else:
             print(f"❌ User login failed: {response.status_code}")
@@ -144,9 +218,11 @@ def test_user_routes():
     # Test get user by ID
     if user_id:
         try:
-            response = requests.get(f"{BASE_URL}/users/{user_id}")
+            response = SESSION.get(
+                f"{BASE_URL}/users/{user_id}", timeout=REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 print(f"✅ Get user by ID: {data.get('email', 'N/A')}")
             else:
                 print(f"❌ Get user by ID failed: {response.status_code}")
@@ -155,9 +231,11 @@ def test_user_routes():
 
     # Test list users
     try:
-        response = requests.get(f"{BASE_URL}/users?page=1&per_page=5")
+        response = SESSION.get(
+            f"{BASE_URL}/users?page=1&per_page=5", timeout=REQUEST_TIMEOUT
+        )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ List users: {data.get('total', 0)} total users")
         else:
             print(f"❌ List users failed: {response.status_code}")
@@ -170,11 +248,24 @@ def test_database_routes():
     print("\n📊 Testing Database Routes...")
     print("-" * 30)
 
+    today = date.today().isoformat()
+    responses = send_all(
+        ("GET", "/corrections?page=1&per_page=5", {}),
+        ("GET", "/corrections/recent?limit=3", {}),
+        ("GET", "/corrections/search?query=store&page=1&per_page=5", {}),
+        (
+            "GET",
+            f"/corrections/date-range?start_date={today}&end_date={today}",
+            {},
+        ),
+        ("GET", "/corrections/1", {}),
+    )
+
     # Test list corrections
     try:
-        response = requests.get(f"{BASE_URL}/corrections?page=1&per_page=5")
+        response = _result(responses[0])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ List corrections: {data.get('total', 0)} total corrections")
         else:
             print(f"❌ List corrections failed: {response.status_code}")
@@ -183,9 +274,9 @@ def test_database_routes():
 
     # Test recent corrections
     try:
-        response = requests.get(f"{BASE_URL}/corrections/recent?limit=3")
+        response = _result(responses[1])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Recent corrections: {len(data)} corrections")
         else:
             print(f"❌ Recent corrections failed: {response.status_code}")
@@ -194,11 +285,9 @@ def test_database_routes():
 
     # Test search corrections
     try:
-        response = requests.get(
-            f"{BASE_URL}/corrections/search?query=store&page=1&per_page=5"
-        )
+        response = _result(responses[2])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Search corrections: {len(data)} results for 'store'")
         else:
             print(f"❌ Search corrections failed: {response.status_code}")
@@ -206,13 +295,10 @@ def test_database_routes():
         print(f"❌ Search corrections error: {e}")
 
     # Test date range corrections
-    today = datetime.now().strftime("%Y-%m-%d")
     try:
-        response = requests.get(
-            f"{BASE_URL}/corrections/date-range?start_date={today}&end_date={today}"
-        )
+        response = _result(responses[3])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Date range corrections: {len(data)} corrections for today")
         else:
             print(f"❌ Date range corrections failed: {response.status_code}")
@@ -221,9 +307,9 @@ def test_database_routes():
 
     # Test get specific correction (using ID 1 as example)
     try:
-        response = requests.get(f"{BASE_URL}/corrections/1")
+        response = _result(responses[4])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Get correction by ID: {data.get('id', 'N/A')}")
         else:
             print(f"❌ Get correction by ID failed: {response.status_code}")
@@ -236,11 +322,17 @@ def test_analytics_routes():
     print("\n📈 Testing Analytics Routes...")
     print("-" * 30)
 
+    responses = send_all(
+        ("GET", "/analytics/stats", {}),
+        ("GET", "/analytics/users/1/corrections?limit=5", {}),
+        ("GET", "/analytics/users/1/correction-count", {}),
+    )
+
     # Test database stats
     try:
-        response = requests.get(f"{BASE_URL}/analytics/stats")
+        response = _result(responses[0])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(
                 f"✅ Database stats: {data.get('total_corrections', 0)} corrections, {data.get('total_users', 0)} users"
             )
@@ -251,9 +343,9 @@ def test_analytics_routes():
 
     # Test user corrections (using user ID 1 as example)
     try:
-        response = requests.get(f"{BASE_URL}/analytics/users/1/corrections?limit=5")
+        response = _result(responses[1])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ User corrections: {len(data)} corrections for user 1")
         else:
             print(f"❌ User corrections failed: {response.status_code}")
@@ -262,9 +354,9 @@ def test_analytics_routes():
 
     # Test user correction count
     try:
-        response = requests.get(f"{BASE_URL}/analytics/users/1/correction-count")
+        response = _result(responses[2])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(
                 f"✅ User correction count: {data.get('total_corrections', 0)} for user 1"
             )
@@ -279,8 +371,13 @@ def test_swagger_documentation():
     print("\n📚 Testing Swagger Documentation...")
     print("-" * 30)
 
+    responses = send_all(
+        ("GET", "/docs", {"status_only": True}),
+        ("GET", "/openapi.json", {}),
+    )
+
     try:
-        response = requests.get(f"{BASE_URL}/docs")
+        response = _result(responses[0])
         if response.status_code == 200:
             print("✅ Swagger documentation accessible")
         else:
@@ -289,9 +386,9 @@ def test_swagger_documentation():
         print(f"❌ Swagger documentation error: {e}")
 
     try:
-        response = requests.get(f"{BASE_URL}/openapi.json")
+        response = _result(responses[1])
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ OpenAPI schema: {data.get('info', {}).get('title', 'N/A')}")
         else:
             print(f"❌ OpenAPI schema failed: {response.status_code}")
@@ -304,9 +401,19 @@ def test_error_scenarios():
     print("\n🚨 Testing Error Scenarios...")
     print("-" * 30)
 
+    responses = send_all(
+        ("GET", "/users/99999", {"status_only": True}),
+        ("GET", "/corrections/99999", {"status_only": True}),
+        (
+            "GET",
+            "/corrections/date-range?start_date=invalid&end_date=invalid",
+            {"status_only": True},
+        ),
+    )
+
     # Test invalid user ID
     try:
-        response = requests.get(f"{BASE_URL}/users/99999")
+        response = _result(responses[0])
         if response.status_code == 404:
             print("✅ 404 error handling: User not found")
         else:
@@ -316,7 +423,7 @@ def test_error_scenarios():
 
     # Test invalid correction ID
     try:
-        response = requests.get(f"{BASE_URL}/corrections/99999")
+        response = _result(responses[1])
         if response.status_code == 404:
             print("✅ 404 error handling: Correction not found")
         else:
@@ -328,17 +435,52 @@ def test_error_scenarios():
 
     # Test invalid date format
     try:
-        response = requests.get(
-            f"{BASE_URL}/corrections/date-range?start_date=invalid&end_date=invalid"
-        )
-        if response.status_code == 400:
-            print("✅ 400 error handling: Invalid date format")
+        response = _result(responses[2])
+        if response.status_code == 422:
+            print("✅ 422 error handling: Invalid date format")
         else:
             print(f"⚠️  Unexpected status for invalid date: {response.status_code}")
     except Exception as e:
         print(f"❌ Error handling test failed: {e}")
 
 
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends each thread's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        return getattr(self.local, "buffer", self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_groups_concurrently(*groups):
+    """Run independent test groups in parallel, printing each group's output whole."""
+    stdout = _PerThreadStdout(sys.stdout)
+
+    def run(group):
+        stdout.local.buffer = io.StringIO()
+        try:
+            group()
+        except Exception as e:
+            print(f"❌ {group.__name__} error: {e}")
+        return stdout.local.buffer.getvalue()
+
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            outputs = list(executor.map(run, groups))
+    finally:
+        sys.stdout = stdout.stream
+
+    for output in outputs:
+        sys.stdout.write(output)
+
+
 def main():
     """Main test function"""
     print("🚀 Comprehensive Route Structure Testing")
@@ -351,14 +493,16 @@ def main():
     print("✅ Analytics Routes (src/grammar_app/routes/analytics.py)")
     print("=" * 60)
 
-    # Test all route categories
-    test_system_routes()
-    test_grammar_routes()
-    test_user_routes()
-    test_database_routes()
-    test_analytics_routes()
-    test_swagger_documentation()
-    test_error_scenarios()
+    # Test all route categories; they share no data, so they run side by side
+    run_groups_concurrently(
+        test_system_routes,
+        test_grammar_routes,
+        test_user_routes,
+        test_database_routes,
+        test_analytics_routes,
+        test_swagger_documentation,
+        test_error_scenarios,
+    )
 
     print("\n" + "=" * 60)
     print("✅ COMPREHENSIVE TESTING COMPLETE!")
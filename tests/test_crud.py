@@ -0,0 +1,135 @@
+"""
+CRUD Tests
+
+Database-level tests for the CRUD helpers, run against the in-memory
+``db_session`` fixture from conftest.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_
+
+from src.grammar_app import crud, models
+
+CORRECTION_TEXTS = (
+    ("she go to school", "She goes to school."),
+    ("He dont like it", "He doesn't like it."),
+    ("they was late", "They were late."),
+    ("I has a cat", "I have a cat."),
+)
+
+
+def _create_user(db, email="crud@example.com"):
+    user = models.User(email=email, full_name="CRUD Test", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _like_search_ids(db, query):
+    """Ids a plain LIKE '%query%' scan over both text columns finds."""
+    rows = db.query(models.GrammarCorrection.id).filter(
+        or_(
+            models.GrammarCorrection.original_text.contains(query),
+            models.GrammarCorrection.corrected_text.contains(query),
+        )
+    )
+    return sorted(row.id for row in rows)
+
+
+def test_search_uses_fts_for_long_queries(db_session):
+    """Queries of 3+ characters go through FTS5, shorter ones through LIKE."""
+    user = _create_user(db_session)
+    for original, corrected in CORRECTION_TEXTS:
+        crud.create_correction(db_session, original, corrected, user_id=user.id)
+
+    long_filter = str(crud._text_search_filter(db_session, "goes"))
+    short_filter = str(crud._text_search_filter(db_session, "go"))
+    assert models.CORRECTIONS_FTS_TABLE in long_filter
+    assert models.CORRECTIONS_FTS_TABLE not in short_filter
+    assert "LIKE" in short_filter
+
+    for query in ("goes", "DONT", "was late", "go", "He", 'a "cat'):
+        found = crud.search_corrections(db_session, query=query, user_id=user.id)
+        assert sorted(c.id for c in found) == _like_search_ids(db_session, query)
+
+
+def _stats_row(db, user_id):
+    return db.get(models.UserStats, user_id, populate_existing=True)
+
+
+def test_user_stats_follow_corrections(db_session):
+    """Triggers keep user_stats in step with inserts and deletes."""
+    user = _create_user(db_session)
+    other = _create_user(db_session, email="other@example.com")
+    crud.create_corrections_bulk(
+        db_session,
+        [
+            {"original_text": original, "corrected_text": corrected, "user_id": user.id}
+            for original, corrected in CORRECTION_TEXTS
+        ],
+    )
+    extra = crud.create_correction(db_session, "a", "A", user_id=user.id)
+    crud.create_correction(db_session, "b", "B", user_id=other.id)
+    crud.create_correction(db_session, "c", "C")
+    assert crud.get_correction_count_by_user(db_session, user.id) == 5
+    assert crud.get_correction_count_by_user(db_session, other.id) == 1
+
+    assert crud.delete_correction(db_session, extra.id)
+    assert crud.get_correction_count_by_user(db_session, user.id) == 4
+    assert crud.get_correction_count_by_user(db_session, other.id) == 1
+
+    # Deleting the user orphans its corrections and drops its counter row
+    assert crud.delete_user(db_session, user.id)
+    assert _stats_row(db_session, user.id) is None
+    assert crud.get_correction_count_by_user(db_session, user.id) == 0
+    assert crud.get_correction_count_by_user(db_session, other.id) == 1
+
+
+def _walk_pages(fetch, per_page):
+    """Follow (created_at, id) cursors through ``fetch`` until a short page."""
+    seen, before, before_id = [], None, None
+    while True:
+        page = fetch(before=before, before_id=before_id, limit=per_page)
+        seen.extend(page)
+        if len(page) < per_page:
+            return seen
+        before, before_id = page[-1].created_at, page[-1].id
+
+
+def test_keyset_pagination_breaks_timestamp_ties(db_session):
+    """Rows sharing a created_at are neither skipped nor repeated across pages."""
+    user = _create_user(db_session)
+    tied = datetime(2024, 1, 1, 12, 0, 0)
+    crud.create_corrections_bulk(
+        db_session,
+        [
+            {
+                "original_text": f"text {index}",
+                "corrected_text": f"Text {index}.",
+                "user_id": user.id,
+                # Five rows share one timestamp, straddling the page boundaries
+                "created_at": tied if index < 5 else tied + timedelta(minutes=index),
+            }
+            for index in range(8)
+        ],
+    )
+    expected = (
+        db_session.query(models.GrammarCorrection)
+        .order_by(
+            models.GrammarCorrection.created_at.desc(),
+            models.GrammarCorrection.id.desc(),
+        )
+        .all()
+    )
+
+    def user_page(**cursor):
+        return crud.get_user_corrections(db_session, user_id=user.id, **cursor)
+
+    def all_page(**cursor):
+        return crud.get_corrections(db_session, **cursor)
+
+    for fetch in (user_page, all_page):
+        for per_page in (1, 2, 3):
+            walked = _walk_pages(fetch, per_page)
+            assert [c.id for c in walked] == [c.id for c in expected]
@@ -4,57 +4,101 @@ Comprehensive test script for grammar correction service
 Tests all grammar correction cases including the truncation fix
 """
 
-from grammar_app.services import correct_grammar
-
-
+import functools
+import io
+import re
+import sys
+from contextlib import redirect_stdout
+
+from grammar_app import services
+from grammar_app.services import batch_correct_grammar, correct_grammar
+
+# Error phrases the checks look for, matched as whole words in one scan
+SENTENCE_ERRORS = re.compile(r"\b(?:is you|goes|don't|was|are|have)\b")
+PARAGRAPH_ERRORS = re.compile(r"\b(?:goes|don't|was|are|have|gets|realizes)\b")
+
+# Deletes the punctuation ignored when comparing words
+PUNCTUATION = str.maketrans("", "", "?.")
+
+
+def buffered_output(test):
+    """Collect a test's prints in memory and write them out in one go."""
+
+    @functools.wraps(test)
+    def wrapper():
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                test()
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    return wrapper
+
+
+def words_without_punctuation(text):
+    """Lowercased words of ``text`` with "?" and "." removed."""
+    return text.lower().translate(PUNCTUATION).split()
+
+
+GRAMMAR_CASES = (
+    # Basic grammar errors
+    "how is you?",
+    "I goes to the store",
+    "She don't like it",
+    "They was happy",
+    "The cat are sleeping",
+    "He have a car",
+    "We is going home",
+    # Complex sentences (test truncation fix)
+    "I want to go market but rain is coming. So what should I do?",
+    "The students was studying hard and they was tired. What should they do?",
+    "She have three cats and they is very playful. Do you like cats?",
+    # Already correct sentences
+    "The book is on the table",
+    "She is beautiful",
+    "They are students",
+)
+
+PARAGRAPH_CASES = (
+    # 3-line paragraph with multiple grammar errors
+    """Yesterday I goes to the store to buy some groceries. The store was very crowded and I have to wait in line for a long time. When I finally gets to the cashier, I realizes I forgot my wallet at home.""",
+    # 4-line paragraph with various grammar issues
+    """My friend Sarah don't like to wake up early in the morning. She always says that she is not a morning person. The problem is that she have to work at 9 AM every day. Her boss don't understand why she is always late to meetings.""",
+    # 5-line paragraph with complex grammar errors
+    """The children was playing in the park when suddenly it starts to rain. They was having so much fun that they don't want to go home. Their parents was worried about them getting wet and cold. The teacher was telling them that they should come inside immediately. But the children was too excited about their game to listen.""",
+    # 6-line paragraph with mixed grammar issues
+    """Last week, I goes to visit my grandparents in the countryside. The weather was beautiful and the air was so fresh. My grandmother was cooking delicious food and she always make my favorite dishes. The problem is that I don't have enough time to stay there for long. My work schedule was very busy and I have many deadlines to meet. But I promises myself that I will visit them again soon.""",
+)
+
+
+@buffered_output
 def test_all_grammar_cases():
     """Test all grammar correction cases"""
 
-    test_cases = [
-        # Basic grammar errors
-        "how is you?",
-        "I goes to the store",
-        "She don't like it",
-        "They was happy",
-        "The cat are sleeping",
-        "He have a car",
-        "We is going home",
-        # Complex sentences (test truncation fix)
-        "I want to go market but rain is coming. So what should I do?",
-        "The students was studying hard and they was tired. What should they do?",
-        "She have three cats and they is very playful. Do you like cats?",
-        # Already correct sentences
-        "The book is on the table",
-        "She is beautiful",
-        "They are students",
-    ]
-
     print("🧪 Testing Grammar Correction Service")
     print("=" * 70)
-    print(f"Total test cases: {len(test_cases)}")
+    print(f"Total test cases: {len(GRAMMAR_CASES)}")
     print("=" * 70)
 
     passed = 0
     failed = 0
 
-    for i, text in enumerate(test_cases, 1):
+    # One batched call: the model pads and generates the cases together
+    corrections = batch_correct_grammar(list(GRAMMAR_CASES))
+
+    for i, (text, corrected) in enumerate(zip(GRAMMAR_CASES, corrections), 1):
         print(f"\n📝 Test {i:2d}:")
         print(f"Original: '{text}'")
-
-        corrected = correct_grammar(text)
-
         print(f"Corrected: '{corrected}'")
         print(f"Changed: {text != corrected}")
 
         # Check if correction was meaningful
         if text != corrected:
             # Additional check: make sure it's not just adding punctuation
-            original_words = (
-                text.lower().replace("?", "").replace(".", "").strip().split()
-            )
-            corrected_words = (
-                corrected.lower().replace("?", "").replace(".", "").strip().split()
-            )
+            original_words = words_without_punctuation(text)
+            corrected_words = words_without_punctuation(corrected)
 
             if original_words != corrected_words:
                 print("✅ Grammar correction successful!")
@@ -64,10 +108,7 @@ def test_all_grammar_cases():
                 passed += 1
         else:
             # Check if this was already correct
-            if any(
-                error in text.lower()
-                for error in ["is you", "goes", "don't", "was", "are", "have"]
-            ):
+            if SENTENCE_ERRORS.search(text.lower()):
                 print("❌ Grammar correction failed!")
                 failed += 1
             else:
@@ -91,52 +132,34 @@ def test_all_grammar_cases():
         print(f"⚠️  {failed} test(s) failed. Check the service for issues.")
 
 
+@buffered_output
 def test_paragraph_cases():
     """Test longer paragraph cases (3-6 lines)"""
 
     print("\n📄 TESTING PARAGRAPH CASES")
     print("=" * 70)
 
-    paragraph_cases = [
-        # 3-line paragraph with multiple grammar errors
-        """Yesterday I goes to the store to buy some groceries. The store was very crowded and I have to wait in line for a long time. When I finally gets to the cashier, I realizes I forgot my wallet at home.""",
-        # 4-line paragraph with various grammar issues
-        """My friend Sarah don't like to wake up early in the morning. She always says that she is not a morning person. The problem is that she have to work at 9 AM every day. Her boss don't understand why she is always late to meetings.""",
-        # 5-line paragraph with complex grammar errors
-        """The children was playing in the park when suddenly it starts to rain. They was having so much fun that they don't want to go home. Their parents was worried about them getting wet and cold. The teacher was telling them that they should come inside immediately. But the children was too excited about their game to listen.""",
-        # 6-line paragraph with mixed grammar issues
-        """Last week, I goes to visit my grandparents in the countryside. The weather was beautiful and the air was so fresh. My grandmother was cooking delicious food and she always make my favorite dishes. The problem is that I don't have enough time to stay there for long. My work schedule was very busy and I have many deadlines to meet. But I promises myself that I will visit them again soon.""",
-    ]
-
     passed = 0
     failed = 0
 
-    for i, paragraph in enumerate(paragraph_cases, 1):
+    corrections = batch_correct_grammar(list(PARAGRAPH_CASES))
+
+    for i, (paragraph, corrected) in enumerate(zip(PARAGRAPH_CASES, corrections), 1):
         print(f"\n📝 Paragraph Test {i}:")
-        print(f"Original ({len(paragraph.split('.'))} sentences):")
+        print(f"Original ({paragraph.count('.') + 1} sentences):")
         print(f"'{paragraph}'")
         print(f"Length: {len(paragraph)} characters")
 
-        corrected = correct_grammar(paragraph)
-
-        print(f"\nCorrected ({len(corrected.split('.'))} sentences):")
+        print(f"\nCorrected ({corrected.count('.') + 1} sentences):")
         print(f"'{corrected}'")
         print(f"Length: {len(corrected)} characters")
         print(f"Changed: {paragraph != corrected}")
 
         # Check if correction was meaningful
         if paragraph != corrected:
-            # Count grammar improvements
-            original_errors = sum(
-                1
-                for error in ["goes", "don't", "was", "are", "have", "gets", "realizes"]
-                if error in paragraph.lower()
-            )
-            corrected_errors = sum(
-                1
-                for error in ["goes", "don't", "was", "are", "have", "gets", "realizes"]
-                if error in corrected.lower()
-            )
+            # Count grammar improvements (distinct error phrases present)
+            original_errors = len(set(PARAGRAPH_ERRORS.findall(paragraph.lower())))
+            corrected_errors = len(set(PARAGRAPH_ERRORS.findall(corrected.lower())))
 
             if corrected_errors < original_errors:
                 print("✅ Grammar correction successful!")
@@ -160,6 +183,7 @@ def test_paragraph_cases():
     print("=" * 70)
 
 
+@buffered_output
 def test_specific_truncation_case():
     """Test the specific case that had truncation issues"""
 
@@ -184,7 +208,21 @@ def test_specific_truncation_case():
     print("=" * 50)
 
 
+def test_case_folded_non_ascii_input():
+    """Characters IGNORECASE folds onto ASCII ("ı", "İ", "ſ") are corrected"""
+
+    cases = {
+        "ı think so": "I think so",
+        "İ am here": "I am here",
+        "she doeſnt care": "She doesn't care",
+    }
+    for text, expected in cases.items():
+        assert services._apply_basic_rules(text) == expected
+        assert correct_grammar(text) == expected
+
+
 if __name__ == "__main__":
     test_all_grammar_cases()
     test_paragraph_cases()
     test_specific_truncation_case()
+    test_case_folded_non_ascii_input()
@@ -330,8 +330,8 @@ def test_error_scenarios():
         response = requests.get(
             f"{BASE_URL}/corrections/date-range?start_date=invalid&end_date=invalid"
         )
-        if response.status_code == 400:
-            print("✅ 400 error handling: Invalid date format")
+        if response.status_code == 422:
+            print("✅ 422 error handling: Invalid date format")
         else:
             print(f"⚠️  Unexpected status for invalid date: {response.status_code}")
     except Exception as e: